@@ -10,6 +10,7 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/6.0/ref/settings/
 """
 
+import os
 from pathlib import Path
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
@@ -45,6 +46,7 @@ MIDDLEWARE = [
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
+    'kalakriti.middleware.ProfileBackendSessionMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
@@ -81,6 +83,44 @@ DATABASES = {
 }
 
 
+# Cache
+# Version keys in kalakriti.caching must be shared by every worker process
+# (and by management commands such as seed_data), so production sets
+# KALA_CACHE_URL to a Redis (redis://host:6379/0) or Memcached
+# (memcached://host:11211) server. Without it each process keeps its own
+# in-memory cache, which only suits a single-process development server.
+
+KALA_CACHE_URL = os.environ.get('KALA_CACHE_URL', '')
+
+if KALA_CACHE_URL.startswith(('redis://', 'rediss://')):
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': KALA_CACHE_URL,
+        }
+    }
+elif KALA_CACHE_URL.startswith('memcached://'):
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.memcached.PyMemcacheCache',
+            'LOCATION': KALA_CACHE_URL.removeprefix('memcached://'),
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        }
+    }
+
+
+# Sessions recorded against the stock ModelBackend are moved over by
+# ProfileBackendSessionMiddleware.
+AUTHENTICATION_BACKENDS = [
+    'kalakriti.backends.ProfileModelBackend',
+]
+
+
 # Password validation
 # https://docs.djangoproject.com/en/6.0/ref/settings/#auth-password-validators
 
@@ -120,7 +160,9 @@ STATIC_ROOT = BASE_DIR / 'staticfiles'
 STATICFILES_DIRS = [BASE_DIR / 'kalakriti' / 'static']
 
 # Media files
-MEDIA_URL = '/media/'
+# Set KALA_MEDIA_URL to a CDN origin (e.g. https://cdn.example.com/media/) in
+# production so image requests are served without reaching Django.
+MEDIA_URL = os.environ.get('KALA_MEDIA_URL', '/media/')
 MEDIA_ROOT = BASE_DIR / 'media'
 
 # Email (console backend for local verification links)
@@ -0,0 +1,152 @@
+"""Buffered ProductActivity writes.
+
+Views, clicks and cart events arrive far more often than anything reads
+them, so ``record_activity`` only queues rows in memory. A daemon thread
+writes them with a single multi-row INSERT once enough have accumulated,
+and at least every couple of seconds otherwise.
+
+The thread uses its own database connection, so the write never joins the
+transaction of the request that queued a row and a request that rolls back
+cannot discard rows queued by others. Rows still queued when the process
+is killed without running ``atexit`` handlers (SIGKILL, OOM) are lost.
+"""
+import atexit
+import logging
+import threading
+
+from django.contrib.auth.models import User
+from django.db import OperationalError, close_old_connections
+
+from .models import Product, ProductActivity, Seller
+from .utils import uuid7
+
+FLUSH_SIZE = 200
+FLUSH_INTERVAL = 2.0
+BULK_BATCH_SIZE = 1000
+# Upper bound on queued rows, so a database outage cannot grow the queue
+# without limit; the oldest rows are dropped first.
+MAX_PENDING = 20000
+
+logger = logging.getLogger(__name__)
+
+_lock = threading.Lock()
+_flush_lock = threading.Lock()
+_wakeup = threading.Event()
+_pending = []
+_dropped = 0
+_flusher = None
+
+
+def record_activity(seller_id, product_id, activity_type, user_id=None, details=None):
+    """Queue one ProductActivity row for the background flusher.
+
+    ``activity_type`` is one of the ProductActivity constants, e.g.
+    ``ProductActivity.VIEW``.
+    """
+    with _lock:
+        _pending.append({
+            'id': uuid7(),
+            'seller_id': Seller._meta.pk.to_python(seller_id),
+            'product_id': Product._meta.pk.to_python(product_id),
+            'activity_type': activity_type,
+            'user_id': user_id,
+            'details': details or {},
+        })
+        _trim()
+        due = len(_pending) >= FLUSH_SIZE
+        _start_flusher()
+    if due:
+        _wakeup.set()
+
+
+def _trim():
+    # Caller holds _lock.
+    global _dropped
+    overflow = len(_pending) - MAX_PENDING
+    if overflow > 0:
+        del _pending[:overflow]
+        _dropped += overflow
+
+
+def _start_flusher():
+    # Started lazily, and again after a fork, since threads do not survive it.
+    global _flusher
+    if _flusher is None or not _flusher.is_alive():
+        _flusher = threading.Thread(target=_run_flusher, name='activity-flusher', daemon=True)
+        _flusher.start()
+
+
+def _run_flusher():
+    while True:
+        _wakeup.wait(FLUSH_INTERVAL)
+        _wakeup.clear()
+        close_old_connections()
+        try:
+            flush_activity()
+        except Exception:
+            logger.exception('Failed to flush queued product activity')
+        finally:
+            close_old_connections()
+
+
+def flush_activity():
+    """Write every queued row and return how many were inserted.
+
+    Called by the flusher thread and at exit; call it outside any
+    transaction, or the rows share that transaction's fate.
+    """
+    global _dropped
+    with _flush_lock:
+        with _lock:
+            batch = _pending[:]
+            _pending.clear()
+            dropped, _dropped = _dropped, 0
+        if dropped:
+            logger.warning('Dropped %d queued product activity rows because the queue was full', dropped)
+        if not batch:
+            return 0
+        try:
+            written = _write(batch)
+        except OperationalError:
+            # The database is unreachable or locked; keep the rows for the
+            # next attempt.
+            with _lock:
+                _pending[:0] = batch
+                _trim()
+            raise
+        return written
+
+
+def _write(batch):
+    # bulk_create skips ProductActivity.save(), so fill the denormalized
+    # names here with one lookup per table. The same lookups reveal rows
+    # whose seller or product was deleted after they were queued; inserting
+    # those would fail the whole batch on the foreign key.
+    shop_names = dict(
+        Seller.objects.filter(pk__in={row['seller_id'] for row in batch}).values_list('id', 'shop_name')
+    )
+    product_names = dict(
+        Product.lean.filter(pk__in={row['product_id'] for row in batch}).values_list('id', 'name')
+    )
+    user_ids = {row['user_id'] for row in batch if row['user_id'] is not None}
+    if user_ids:
+        user_ids = set(User.objects.filter(pk__in=user_ids).values_list('pk', flat=True))
+    rows = [row for row in batch if row['seller_id'] in shop_names and row['product_id'] in product_names]
+    if len(rows) < len(batch):
+        logger.warning('Skipped %d product activity rows for deleted sellers or products', len(batch) - len(rows))
+    ProductActivity.objects.bulk_create(
+        [
+            ProductActivity(
+                seller_shop_name=shop_names[row['seller_id']],
+                product_name=product_names[row['product_id']],
+                **{**row, 'user_id': row['user_id'] if row['user_id'] in user_ids else None},
+            )
+            for row in rows
+        ],
+        batch_size=BULK_BATCH_SIZE,
+        ignore_conflicts=True,
+    )
+    return len(rows)
+
+
+atexit.register(flush_activity)
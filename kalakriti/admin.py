@@ -1,6 +1,6 @@
 from django.contrib import admin
 from .models import (
-    Category, Region, Artisan, Product, CulturalStory, 
+    Category, Region, Artisan, Product, ProductGalleryImage, CulturalStory, 
     GalleryImage, Order, OrderItem, Newsletter, Favorite
 )
 
@@ -32,15 +32,24 @@ class ArtisanAdmin(admin.ModelAdmin):
     prepopulated_fields = {'slug': ('name',)}
     search_fields = ('name', 'specialty', 'region__name')
     list_filter = ('featured', 'region', 'created_at', 'years_of_experience')
+    list_select_related = ('region',)
     readonly_fields = ('created_at', 'updated_at')
 
 
+class ProductGalleryImageInline(admin.TabularInline):
+    model = ProductGalleryImage
+    extra = 1
+
+
 @admin.register(Product)
 class ProductAdmin(admin.ModelAdmin):
     list_display = ('name', 'category', 'artisan', 'price', 'in_stock', 'featured', 'created_at')
     prepopulated_fields = {'slug': ('name',)}
     search_fields = ('name', 'category__name', 'artisan__name')
     list_filter = ('category', 'region', 'featured', 'in_stock', 'created_at')
+    list_select_related = ('category', 'artisan', 'region')
+    autocomplete_fields = ('category', 'region', 'artisan')
+    inlines = [ProductGalleryImageInline]
     readonly_fields = ('created_at', 'updated_at')
     fieldsets = (
         ('Basic Information', {
@@ -56,7 +65,7 @@ class ProductAdmin(admin.ModelAdmin):
             'fields': ('stock', 'in_stock')
         }),
         ('Media', {
-            'fields': ('image', 'gallery_images')
+            'fields': ('image',)
         }),
         ('Promotion', {
             'fields': ('featured',)
@@ -77,6 +86,7 @@ class CulturalStoryAdmin(admin.ModelAdmin):
     prepopulated_fields = {'slug': ('title',)}
     search_fields = ('title', 'content', 'region__name')
     list_filter = ('region', 'published', 'category', 'created_at')
+    list_select_related = ('region',)
     readonly_fields = ('created_at', 'updated_at')
 
 
@@ -85,12 +95,15 @@ class GalleryImageAdmin(admin.ModelAdmin):
     list_display = ('title', 'artisan', 'product', 'region', 'featured', 'created_at')
     search_fields = ('title', 'description')
     list_filter = ('featured', 'created_at', 'artisan', 'product', 'region')
+    list_select_related = ('artisan', 'product', 'region')
+    autocomplete_fields = ('artisan', 'product', 'region')
     readonly_fields = ('created_at',)
 
 
 class OrderItemInline(admin.TabularInline):
     model = OrderItem
     extra = 1
+    autocomplete_fields = ('product',)
 
 
 @admin.register(Order)
@@ -99,7 +112,9 @@ class OrderAdmin(admin.ModelAdmin):
     inlines = [OrderItemInline]
     search_fields = ('user__email', 'id')
     list_filter = ('status', 'created_at')
-    readonly_fields = ('created_at', 'updated_at', 'id')
+    list_select_related = ('user',)
+    autocomplete_fields = ('user',)
+    readonly_fields = ('created_at', 'updated_at', 'id', 'total_amount')
     fieldsets = (
         ('Order Information', {
             'fields': ('id', 'user', 'status')
@@ -130,4 +145,6 @@ class FavoriteAdmin(admin.ModelAdmin):
     list_display = ('user', 'product', 'created_at')
     search_fields = ('user__email', 'product__name')
     list_filter = ('created_at',)
+    list_select_related = ('user', 'product')
+    autocomplete_fields = ('user', 'product')
     readonly_fields = ('created_at',)
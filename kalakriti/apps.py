@@ -3,3 +3,6 @@ from django.apps import AppConfig
 
 class KalakritiConfig(AppConfig):
     name = 'kalakriti'
+
+    def ready(self):
+        from . import signals  # noqa: F401
@@ -0,0 +1,34 @@
+import hashlib
+
+from django.core.cache import cache
+
+
+def get_version(version_key):
+    """Return the current version number stored under ``version_key``."""
+    return cache.get_or_set(version_key, 1, None)
+
+
+def bump_version(version_key):
+    """Invalidate everything cached under ``version_key`` by moving to a new version."""
+    cache.add(version_key, 1, None)
+    try:
+        cache.incr(version_key)
+    except ValueError:
+        # The key was evicted between add() and incr().
+        cache.set(version_key, 1, None)
+
+
+def versioned_get_or_set(version_key, key, default, timeout):
+    """Like ``cache.get_or_set`` but scoped to the current version of ``version_key``."""
+    return cache.get_or_set(f'{key}:v{get_version(version_key)}', default, timeout)
+
+
+def cached_queryset(queryset, timeout, version_key):
+    """Evaluate ``queryset`` and cache the rows until ``version_key`` is bumped.
+
+    The key is a hash of the compiled SQL and parameters, so equivalent
+    querysets built in different places share one cache entry.
+    """
+    sql, params = queryset.query.sql_with_params()
+    digest = hashlib.blake2b(f'{sql}|{params!r}'.encode(), digest_size=16).hexdigest()
+    return versioned_get_or_set(version_key, f'qs:{digest}', lambda: list(queryset), timeout)
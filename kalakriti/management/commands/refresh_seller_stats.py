@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+from decimal import Decimal
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Avg, Count, DecimalField, F, Sum
+
+from kalakriti.models import OrderItem, Product, Seller
+
+
+class Command(BaseCommand):
+    help = (
+        "Recompute the aggregate Seller columns (total_products, total_sales, rating). "
+        "Meant to run periodically, e.g. from cron, instead of updating sellers on every order."
+    )
+
+    def handle(self, *args, **options):
+        catalog = {
+            row["seller_id"]: row
+            for row in Product.objects.filter(seller__isnull=False)
+            .values("seller_id")
+            .annotate(count=Count("id"), rating=Avg("rating"))
+            .order_by()
+        }
+        sales = dict(
+            OrderItem.objects.filter(product__seller__isnull=False)
+            .exclude(order__status="cancelled")
+            .values_list("product__seller_id")
+            .annotate(
+                total=Sum(
+                    F("price") * F("quantity"),
+                    output_field=DecimalField(max_digits=12, decimal_places=2),
+                )
+            )
+            .order_by()
+        )
+
+        sellers = list(Seller.objects.only("id", "total_products", "total_sales", "rating"))
+        for seller in sellers:
+            stats = catalog.get(seller.id, {})
+            seller.total_products = stats.get("count", 0)
+            seller.total_sales = sales.get(seller.id) or Decimal("0.00")
+            seller.rating = round(Decimal(stats.get("rating") or 0), 2)
+
+        with transaction.atomic():
+            Seller.objects.bulk_update(sellers, ["total_products", "total_sales", "rating"], batch_size=500)
+
+        self.stdout.write(self.style.SUCCESS(f"Refreshed stats for {len(sellers)} sellers."))
@@ -1,26 +1,32 @@
 from __future__ import annotations
 
+import os
 import random
 from decimal import Decimal
+from functools import lru_cache
 from pathlib import Path
 
 from django.conf import settings
+from django.contrib.auth.hashers import make_password
 from django.contrib.auth.models import User
 from django.core.management.base import BaseCommand
-from django.db import transaction
-from django.utils.text import slugify
-from django.utils import timezone
+from django.core.management.color import no_style
+from django.db import connection, transaction
+from django.db.models import Count
 
+from kalakriti.caching import bump_version
 from kalakriti.models import (
     Artisan,
     Category,
     CulturalStory,
+    FeedItem,
     GalleryImage,
     Newsletter,
     Order,
     OrderItem,
     Product,
     ProductActivity,
+    ProductGalleryImage,
     Region,
     Seller,
     SellerProduct,
@@ -28,11 +34,72 @@ from kalakriti.models import (
     UserProfile,
 )
 
-try:
-    from PIL import Image, ImageDraw
-except Exception:  # pragma: no cover - pillow should be available in environment
-    Image = None
-    ImageDraw = None
+BATCH_SIZE = 500
+
+IMAGE_SIZE = (900, 600)
+
+MEDIA_FOLDERS = frozenset(
+    {
+        "categories",
+        "regions",
+        "artisans",
+        "products",
+        "stories",
+        "gallery",
+        "shop_logos",
+        "profiles",
+    }
+)
+
+SEED_IMAGES = [
+    ("categories/textiles.jpg", "Textiles"),
+    ("categories/pottery.jpg", "Pottery"),
+    ("categories/jewelry.jpg", "Jewelry"),
+    ("categories/paintings.jpg", "Paintings"),
+    ("regions/rajasthan.jpg", "Rajasthan"),
+    ("regions/gujarat.jpg", "Gujarat"),
+    ("regions/west-bengal.jpg", "West Bengal"),
+    ("regions/tamil-nadu.jpg", "Tamil Nadu"),
+    ("artisans/meera-sharma.jpg", "Meera"),
+    ("artisans/arjun-patel.jpg", "Arjun"),
+    ("artisans/riya-sen.jpg", "Riya"),
+    ("artisans/karthik-iyer.jpg", "Karthik"),
+    ("products/blue-pottery-vase.jpg", "Blue Vase"),
+    ("products/ajrakh-stole.jpg", "Ajrakh"),
+    ("products/terracotta-lamp.jpg", "Lamp"),
+    ("products/kalamkari-wall-art.jpg", "Kalamkari"),
+    ("products/silver-jhumkas.jpg", "Jhumkas"),
+    ("products/kantha-throw.jpg", "Kantha"),
+    ("stories/heritage-textiles.jpg", "Heritage"),
+    ("stories/craft-traditions.jpg", "Traditions"),
+    ("gallery/loom.jpg", "Loom"),
+    ("gallery/atelier.jpg", "Atelier"),
+    ("shop_logos/sadbhav-crafts.jpg", "Sadbhav"),
+    ("shop_logos/raaga-studio.jpg", "Raaga"),
+    ("shop_logos/sundar-collective.jpg", "Sundar"),
+    ("profiles/buyer1.jpg", "Buyer"),
+    ("profiles/buyer2.jpg", "Buyer"),
+]
+
+
+def _color_for(seed: str):
+    # A private generator keeps the colours stable without reseeding the
+    # global RNG used for the rest of the demo data.
+    rng = random.Random(seed)
+    return (
+        rng.randint(40, 200),
+        rng.randint(40, 200),
+        rng.randint(40, 200),
+    )
+
+
+PALETTE = {label: _color_for(label) for _, label in SEED_IMAGES}
+
+
+@lru_cache(maxsize=None)
+def _password_hash(raw_password: str) -> str:
+    # Seed users share a password, so run the (deliberately slow) hasher once.
+    return make_password(raw_password)
 
 
 class Command(BaseCommand):
@@ -46,7 +113,17 @@ class Command(BaseCommand):
         )
 
     def handle(self, *args, **options):
+        if not options.get("reset") and self._already_seeded():
+            self.stdout.write("Database already seeded; skipping. Use --reset to reseed.")
+            return
+
         with transaction.atomic():
+            if connection.vendor == "postgresql":
+                # Seed data is idempotent and can simply be re-run, so there is
+                # no need to wait for the WAL flush when the transaction commits.
+                with connection.cursor() as cursor:
+                    cursor.execute("SET LOCAL synchronous_commit TO OFF")
+
             if options.get("reset"):
                 self._reset_data()
 
@@ -67,90 +144,77 @@ class Command(BaseCommand):
             self._create_product_activity(sellers, products, users)
             self._create_newsletters(users)
 
+        # Bulk inserts and the reset flush bypass model signals, so drop the
+        # cached querysets explicitly.
+        for model in (Category, Region, Product, Artisan, CulturalStory, GalleryImage):
+            bump_version(model.CACHE_VERSION_KEY)
+
         self.stdout.write(self.style.SUCCESS("Database seeded successfully."))
 
+    def _already_seeded(self):
+        return Product.objects.count() >= 6 and Order.objects.count() >= 2
+
     def _reset_data(self):
-        OrderItem.objects.all().delete()
-        Order.objects.all().delete()
-        ProductActivity.objects.all().delete()
-        SellerProduct.objects.all().delete()
-        Product.objects.all().delete()
-        GalleryImage.objects.all().delete()
-        CulturalStory.objects.all().delete()
-        StoryPost.objects.all().delete()
-        Artisan.objects.all().delete()
-        Seller.objects.all().delete()
-        UserProfile.objects.all().delete()
-        Newsletter.objects.all().delete()
-        Category.objects.all().delete()
-        Region.objects.all().delete()
+        # Flush the app tables in one statement (TRUNCATE ... CASCADE on
+        # PostgreSQL) instead of running Django's row-by-row delete collector.
+        tables = [
+            model._meta.db_table
+            for model in (
+                OrderItem,
+                Order,
+                ProductActivity,
+                SellerProduct,
+                Product,
+                GalleryImage,
+                CulturalStory,
+                FeedItem,
+                StoryPost,
+                Artisan,
+                Seller,
+                UserProfile,
+                Newsletter,
+                Category,
+                Region,
+            )
+        ]
+        sql_list = connection.ops.sql_flush(no_style(), tables, reset_sequences=True, allow_cascade=True)
+        connection.ops.execute_sql_flush(sql_list)
         User.objects.exclude(is_superuser=True).delete()
 
     def _ensure_media_dirs(self):
         media_root = Path(settings.MEDIA_ROOT)
-        for folder in [
-            "categories",
-            "regions",
-            "artisans",
-            "products",
-            "stories",
-            "gallery",
-            "shop_logos",
-            "profiles",
-        ]:
+        try:
+            with os.scandir(media_root) as entries:
+                existing = {entry.name for entry in entries if entry.is_dir()}
+        except FileNotFoundError:
+            existing = set()
+
+        for folder in MEDIA_FOLDERS - existing:
             (media_root / folder).mkdir(parents=True, exist_ok=True)
 
     def _create_images(self):
-        if Image is None:
-            return
-
         media_root = Path(settings.MEDIA_ROOT)
-        items = [
-            ("categories/textiles.jpg", "Textiles"),
-            ("categories/pottery.jpg", "Pottery"),
-            ("categories/jewelry.jpg", "Jewelry"),
-            ("categories/paintings.jpg", "Paintings"),
-            ("regions/rajasthan.jpg", "Rajasthan"),
-            ("regions/gujarat.jpg", "Gujarat"),
-            ("regions/west-bengal.jpg", "West Bengal"),
-            ("regions/tamil-nadu.jpg", "Tamil Nadu"),
-            ("artisans/meera-sharma.jpg", "Meera"),
-            ("artisans/arjun-patel.jpg", "Arjun"),
-            ("artisans/riya-sen.jpg", "Riya"),
-            ("artisans/karthik-iyer.jpg", "Karthik"),
-            ("products/blue-pottery-vase.jpg", "Blue Vase"),
-            ("products/ajrakh-stole.jpg", "Ajrakh"),
-            ("products/terracotta-lamp.jpg", "Lamp"),
-            ("products/kalamkari-wall-art.jpg", "Kalamkari"),
-            ("products/silver-jhumkas.jpg", "Jhumkas"),
-            ("products/kantha-throw.jpg", "Kantha"),
-            ("stories/heritage-textiles.jpg", "Heritage"),
-            ("stories/craft-traditions.jpg", "Traditions"),
-            ("gallery/loom.jpg", "Loom"),
-            ("gallery/atelier.jpg", "Atelier"),
-            ("shop_logos/sadbhav-crafts.jpg", "Sadbhav"),
-            ("shop_logos/raaga-studio.jpg", "Raaga"),
-            ("shop_logos/sundar-collective.jpg", "Sundar"),
-            ("profiles/buyer1.jpg", "Buyer"),
-            ("profiles/buyer2.jpg", "Buyer"),
+        missing = [
+            (media_root / rel_path, label)
+            for rel_path, label in SEED_IMAGES
+            if not (media_root / rel_path).exists()
         ]
+        if not missing:
+            return
 
-        for rel_path, label in items:
-            file_path = media_root / rel_path
-            if file_path.exists():
-                continue
-            image = Image.new("RGB", (900, 600), self._color_for(label))
-            draw = ImageDraw.Draw(image)
-            draw.text((40, 40), label, fill=(255, 255, 255))
-            image.save(file_path, format="JPEG", quality=85)
-
-    def _color_for(self, seed: str):
-        random.seed(seed)
-        return (
-            random.randint(40, 200),
-            random.randint(40, 200),
-            random.randint(40, 200),
-        )
+        # Pillow is only imported when there is something to paint.
+        try:
+            from PIL import Image, ImageDraw, ImageFont
+        except ImportError:  # pragma: no cover - pillow should be available in environment
+            return
+
+        font = ImageFont.load_default()
+        canvas = Image.new("RGB", IMAGE_SIZE)
+        draw = ImageDraw.Draw(canvas)
+        for file_path, label in missing:
+            canvas.paste(PALETTE[label], (0, 0, *IMAGE_SIZE))
+            draw.text((40, 40), label, fill=(255, 255, 255), font=font)
+            canvas.save(file_path, format="JPEG", quality=85, optimize=False)
 
     def _create_users(self):
         users = {}
@@ -180,99 +244,108 @@ class Command(BaseCommand):
             }
         )
 
-        self._create_profile(buyer1, "buyer", "+91-9876543210", "Jaipur")
-        self._create_profile(buyer2, "buyer", "+91-9898989898", "Ahmedabad")
-        self._create_profile(seller1, "seller", "+91-9000000001", "Jaipur")
-        self._create_profile(seller2, "seller", "+91-9000000002", "Kolkata")
-        self._create_profile(seller3, "seller", "+91-9000000003", "Chennai")
+        UserProfile.objects.bulk_create(
+            [
+                self._build_profile(buyer1, "buyer", "+91-9876543210", "Jaipur"),
+                self._build_profile(buyer2, "buyer", "+91-9898989898", "Ahmedabad"),
+                self._build_profile(seller1, "seller", "+91-9000000001", "Jaipur"),
+                self._build_profile(seller2, "seller", "+91-9000000002", "Kolkata"),
+                self._build_profile(seller3, "seller", "+91-9000000003", "Chennai"),
+            ],
+            update_conflicts=True,
+            unique_fields=["user"],
+            update_fields=["user_type", "phone", "address", "city", "state", "pincode", "profile_image"],
+        )
 
         return users
 
     def _get_or_create_user(self, username: str, email: str, password: str):
         user, created = User.objects.get_or_create(username=username, defaults={"email": email})
         if created or not user.has_usable_password():
-            user.set_password(password)
+            user.password = _password_hash(password)
             user.save(update_fields=["password"])
         return user
 
-    def _create_profile(self, user: User, user_type: str, phone: str, city: str):
-        UserProfile.objects.get_or_create(
+    def _build_profile(self, user: User, user_type: str, phone: str, city: str):
+        return UserProfile(
             user=user,
-            defaults={
-                "user_type": user_type,
-                "phone": phone,
-                "address": f"{city} Heritage Street, Craft Block",
-                "city": city,
-                "state": "India",
-                "pincode": "302001",
-                "profile_image": "profiles/buyer1.jpg" if user_type == "buyer" else "profiles/buyer2.jpg",
-            },
+            user_type=user_type,
+            phone=phone,
+            address=f"{city} Heritage Street, Craft Block",
+            city=city,
+            state="India",
+            pincode="302001",
+            profile_image="profiles/buyer1.jpg" if user_type == "buyer" else "profiles/buyer2.jpg",
         )
 
     def _create_regions(self):
-        regions = []
         entries = [
             (
                 "Rajasthan",
+                "rajasthan",
                 "Vibrant desert culture with block printing, blue pottery, and mirror work.",
             ),
             (
                 "Gujarat",
+                "gujarat",
                 "Home to Ajrakh, Patola, and folk embroidery traditions.",
             ),
             (
                 "West Bengal",
+                "west-bengal",
                 "Known for Kantha, terracotta, and storytelling through textiles.",
             ),
             (
                 "Tamil Nadu",
+                "tamil-nadu",
                 "Celebrated for Kalamkari, bronze casting, and temple arts.",
             ),
         ]
 
-        for name, description in entries:
-            slug = slugify(name)
-            region, _ = Region.objects.get_or_create(
-                slug=slug,
-                defaults={
-                    "name": name,
-                    "description": description,
-                    "image": f"regions/{slug}.jpg",
-                    "cultural_heritage": f"{name} preserves legacy craft communities and heritage guilds.",
-                },
-            )
-            regions.append(region)
-
-        return regions
+        Region.objects.bulk_create(
+            [
+                Region(
+                    slug=slug,
+                    name=name,
+                    description=description,
+                    image=f"regions/{slug}.jpg",
+                    cultural_heritage=f"{name} preserves legacy craft communities and heritage guilds.",
+                )
+                for name, slug, description in entries
+            ],
+            ignore_conflicts=True,
+            batch_size=BATCH_SIZE,
+        )
+        return self._fetch_by_slug(Region, [entry[1] for entry in entries])
 
     def _create_categories(self):
-        categories = []
         entries = [
-            ("Textiles", "Handwoven stoles, sarees, and throws."),
-            ("Pottery", "Terracotta and glazed ceramic pieces."),
-            ("Jewelry", "Silver, beadwork, and folk accessories."),
-            ("Paintings", "Narrative paintings and wall art."),
+            ("Textiles", "textiles", "Handwoven stoles, sarees, and throws."),
+            ("Pottery", "pottery", "Terracotta and glazed ceramic pieces."),
+            ("Jewelry", "jewelry", "Silver, beadwork, and folk accessories."),
+            ("Paintings", "paintings", "Narrative paintings and wall art."),
         ]
 
-        for name, description in entries:
-            slug = slugify(name)
-            category, _ = Category.objects.get_or_create(
-                slug=slug,
-                defaults={
-                    "name": name,
-                    "description": description,
-                    "image": f"categories/{slug}.jpg",
-                },
-            )
-            categories.append(category)
-
-        return categories
+        Category.objects.bulk_create(
+            [
+                Category(
+                    slug=slug,
+                    name=name,
+                    description=description,
+                    image=f"categories/{slug}.jpg",
+                )
+                for name, slug, description in entries
+            ],
+            ignore_conflicts=True,
+            batch_size=BATCH_SIZE,
+        )
+        return self._fetch_by_slug(Category, [entry[1] for entry in entries])
 
     def _create_artisans(self, regions):
-        artisans = []
         entries = [
             (
                 "Meera Sharma",
+                "meera-sharma",
                 "Blue pottery artisan specializing in floral glaze work.",
                 "Blue Pottery",
                 12,
@@ -281,6 +354,7 @@ class Command(BaseCommand):
             ),
             (
                 "Arjun Patel",
+                "arjun-patel",
                 "Ajrakh block printer with a focus on natural dyes.",
                 "Ajrakh Printing",
                 18,
@@ -289,6 +363,7 @@ class Command(BaseCommand):
             ),
             (
                 "Riya Sen",
+                "riya-sen",
                 "Kantha storyteller bringing heritage motifs to modern throws.",
                 "Kantha Embroidery",
                 10,
@@ -297,6 +372,7 @@ class Command(BaseCommand):
             ),
             (
                 "Karthik Iyer",
+                "karthik-iyer",
                 "Kalamkari painter known for temple-inspired wall art.",
                 "Kalamkari",
                 15,
@@ -305,27 +381,28 @@ class Command(BaseCommand):
             ),
         ]
 
-        for name, bio, specialty, experience, region, featured in entries:
-            slug = slugify(name)
-            artisan, _ = Artisan.objects.get_or_create(
-                slug=slug,
-                defaults={
-                    "name": name,
-                    "bio": bio,
-                    "image": f"artisans/{slug}.jpg",
-                    "region": region,
-                    "specialty": specialty,
-                    "years_of_experience": experience,
-                    "email": f"{slug}@kala.local",
-                    "phone": "+91-9000011122",
-                    "website": f"https://{slug}.example.com",
-                    "social_media_links": {"instagram": f"https://instagram.com/{slug}"},
-                    "featured": featured,
-                },
-            )
-            artisans.append(artisan)
-
-        return artisans
+        Artisan.objects.bulk_create(
+            [
+                Artisan(
+                    slug=slug,
+                    name=name,
+                    bio=bio,
+                    image=f"artisans/{slug}.jpg",
+                    region=region,
+                    specialty=specialty,
+                    years_of_experience=experience,
+                    email=f"{slug}@kala.local",
+                    phone="+91-9000011122",
+                    website=f"https://{slug}.example.com",
+                    social_media_links={"instagram": f"https://instagram.com/{slug}"},
+                    featured=featured,
+                )
+                for name, slug, bio, specialty, experience, region, featured in entries
+            ],
+            ignore_conflicts=True,
+            batch_size=BATCH_SIZE,
+        )
+        return self._fetch_by_slug(Artisan, [entry[1] for entry in entries])
 
     def _create_sellers(self, users, regions):
         sellers = []
@@ -353,7 +430,8 @@ class Command(BaseCommand):
             ),
         ]
 
-        for user, name, description, state, logo in entries:
+        ratings = [Decimal(f"{random.uniform(4.2, 4.9):.2f}") for _ in entries]
+        for (user, name, description, state, logo), rating in zip(entries, ratings):
             seller, _ = Seller.objects.get_or_create(
                 user=user,
                 defaults={
@@ -365,7 +443,7 @@ class Command(BaseCommand):
                     "bank_account": "1234567890",
                     "bank_name": "Kala Bank",
                     "ifsc_code": "KALA0001234",
-                    "rating": round(random.uniform(4.2, 4.9), 2),
+                    "rating": rating,
                     "is_verified": True,
                 },
             )
@@ -374,10 +452,10 @@ class Command(BaseCommand):
         return sellers
 
     def _create_products(self, categories, regions, artisans, sellers):
-        products = []
         entries = [
             (
                 "Blue Pottery Vase",
+                "blue-pottery-vase",
                 "Hand-painted blue pottery vase with floral patterns.",
                 categories[1],
                 regions[0],
@@ -390,6 +468,7 @@ class Command(BaseCommand):
             ),
             (
                 "Ajrakh Cotton Stole",
+                "ajrakh-cotton-stole",
                 "Naturally dyed Ajrakh stole with geometric motifs.",
                 categories[0],
                 regions[1],
@@ -402,6 +481,7 @@ class Command(BaseCommand):
             ),
             (
                 "Terracotta Lamp",
+                "terracotta-lamp",
                 "Handcrafted terracotta lamp with cutwork design.",
                 categories[1],
                 regions[2],
@@ -414,6 +494,7 @@ class Command(BaseCommand):
             ),
             (
                 "Kalamkari Wall Art",
+                "kalamkari-wall-art",
                 "Detailed Kalamkari wall art inspired by temple narratives.",
                 categories[3],
                 regions[3],
@@ -426,6 +507,7 @@ class Command(BaseCommand):
             ),
             (
                 "Silver Jhumkas",
+                "silver-jhumkas",
                 "Hand-finished silver jhumkas with bead detailing.",
                 categories[2],
                 regions[1],
@@ -438,6 +520,7 @@ class Command(BaseCommand):
             ),
             (
                 "Kantha Throw",
+                "kantha-throw",
                 "Soft Kantha throw with layered storytelling motifs.",
                 categories[0],
                 regions[2],
@@ -450,87 +533,120 @@ class Command(BaseCommand):
             ),
         ]
 
-        for name, desc, category, region, artisan, seller, price, image, featured, stock in entries:
-            slug = slugify(name)
-            product, _ = Product.objects.get_or_create(
-                slug=slug,
-                defaults={
-                    "name": name,
-                    "description": desc,
-                    "category": category,
-                    "region": region,
-                    "artisan": artisan,
-                    "seller": seller,
-                    "price": price,
-                    "original_price": price + Decimal("400.00"),
-                    "stock": stock,
-                    "image": image,
-                    "gallery_images": [image],
-                    "featured": featured,
-                    "in_stock": stock > 0,
-                    "rating": round(random.uniform(4.1, 4.9), 2),
-                    "reviews_count": random.randint(6, 42),
-                },
-            )
-            products.append(product)
+        ratings = [Decimal(f"{random.uniform(4.1, 4.9):.2f}") for _ in entries]
+        reviews = random.choices(range(6, 43), k=len(entries))
+        Product.objects.bulk_create(
+            [
+                Product(
+                    slug=slug,
+                    name=name,
+                    description=desc,
+                    category=category,
+                    region=region,
+                    artisan=artisan,
+                    seller=seller,
+                    price=price,
+                    original_price=price + Decimal("400.00"),
+                    stock=stock,
+                    image=image,
+                    featured=featured,
+                    in_stock=stock > 0,
+                    rating=rating,
+                    reviews_count=reviews_count,
+                )
+                for (
+                    (name, slug, desc, category, region, artisan, seller, price, image, featured, stock),
+                    rating,
+                    reviews_count,
+                ) in zip(entries, ratings, reviews)
+            ],
+            ignore_conflicts=True,
+            batch_size=BATCH_SIZE,
+        )
+        products = self._fetch_by_slug(Product, [entry[1] for entry in entries])
+        ProductGalleryImage.objects.bulk_create(
+            [ProductGalleryImage(product=product, image=product.image.name, position=0) for product in products],
+            ignore_conflicts=True,
+            batch_size=BATCH_SIZE,
+        )
 
-        for seller in sellers:
-            seller.total_products = Product.objects.filter(seller=seller).count()
-            seller.total_sales = Decimal(random.randint(50, 200)) * Decimal("100.00")
-            seller.save(update_fields=["total_products", "total_sales"])
+        counts = dict(
+            Product.objects.filter(seller__in=sellers)
+            .values_list("seller_id")
+            .annotate(count=Count("id"))
+            .order_by()
+        )
+        sales = random.choices(range(50, 201), k=len(sellers))
+        for seller, units in zip(sellers, sales):
+            seller.total_products = counts.get(seller.id, 0)
+            seller.total_sales = Decimal(units) * Decimal("100.00")
+        Seller.objects.bulk_update(sellers, ["total_products", "total_sales"])
 
         return products
 
     def _create_seller_products(self, sellers, products):
-        for product in products:
-            SellerProduct.objects.get_or_create(
-                seller=product.seller,
-                product=product,
-                defaults={
-                    "seller_sku": f"{product.slug[:10].upper()}-{random.randint(1000, 9999)}",
-                    "seller_price": product.price,
-                    "seller_stock": product.stock,
-                },
-            )
+        # ignore_conflicts also swallows seller_sku collisions, so the SKU has
+        # to be stable across runs rather than random.
+        SellerProduct.objects.bulk_create(
+            [
+                SellerProduct(
+                    seller=product.seller,
+                    product=product,
+                    seller_sku=f"{product.slug[:10].upper()}-{1001 + index}",
+                    seller_price=product.price,
+                    seller_stock=product.stock,
+                )
+                for index, product in enumerate(products)
+            ],
+            ignore_conflicts=True,
+            batch_size=BATCH_SIZE,
+        )
 
     def _create_stories(self, regions):
         entries = [
             (
                 "Threads of the Desert",
+                "threads-of-the-desert",
                 "Rajasthan's textile heritage blends color, mirror work, and nomadic tales.",
                 regions[0],
             ),
             (
                 "Ajrakh and the Rhythm of Print",
+                "ajrakh-and-the-rhythm-of-print",
                 "Ajrakh printing is a ritual of dye, patience, and geometry.",
                 regions[1],
             ),
             (
                 "Kantha: Stories in Stitches",
+                "kantha-stories-in-stitches",
                 "Bengal's Kantha reflects memory, daily life, and resilience.",
                 regions[2],
             ),
             (
                 "Temple Murals and Kalamkari",
+                "temple-murals-and-kalamkari",
                 "Tamil Nadu's Kalamkari connects myth, craft, and devotion.",
                 regions[3],
             ),
         ]
 
-        for title, content, region in entries:
-            slug = slugify(title)
-            CulturalStory.objects.get_or_create(
-                slug=slug,
-                defaults={
-                    "title": title,
-                    "content": content,
-                    "author": "Kala Editorial",
-                    "featured_image": "stories/heritage-textiles.jpg",
-                    "region": region,
-                    "category": "Heritage",
-                    "published": True,
-                },
-            )
+        CulturalStory.objects.bulk_create(
+            [
+                CulturalStory(
+                    slug=slug,
+                    title=title,
+                    content=content,
+                    author="Kala Editorial",
+                    featured_image="stories/heritage-textiles.jpg",
+                    region=region,
+                    category="Heritage",
+                    published=True,
+                )
+                for title, slug, content, region in entries
+            ],
+            ignore_conflicts=True,
+            batch_size=BATCH_SIZE,
+        )
 
     def _create_story_posts(self, users):
         entries = [
@@ -541,9 +657,16 @@ class Command(BaseCommand):
             (users["seller3"], "Thank you for the support on our latest craft launch!"),
         ]
 
-        for user, content in entries:
-            if not StoryPost.objects.filter(user=user, content=content).exists():
-                StoryPost.objects.create(user=user, content=content)
+        existing = set(
+            StoryPost.objects.filter(user__in=[user for user, _ in entries]).values_list("user_id", "content")
+        )
+        posts = StoryPost.objects.bulk_create(
+            [StoryPost(user=user, content=content) for user, content in entries if (user.id, content) not in existing],
+            batch_size=BATCH_SIZE,
+        )
+        # bulk_create skips the post_save signal that normally projects posts
+        # into the feed, so build the feed rows here.
+        FeedItem.objects.bulk_create([FeedItem.from_post(post) for post in posts], batch_size=BATCH_SIZE)
 
     def _create_gallery(self, artisans, products, regions):
         entries = [
@@ -554,72 +677,92 @@ class Command(BaseCommand):
             ("Desert Workshop", "gallery/loom.jpg", None, None, regions[0], False),
         ]
 
-        for title, image, artisan, product, region, featured in entries:
-            GalleryImage.objects.get_or_create(
-                title=title,
-                defaults={
-                    "image": image,
-                    "description": f"{title} capturing the craft process.",
-                    "artisan": artisan,
-                    "product": product,
-                    "region": region,
-                    "featured": featured,
-                },
-            )
+        # Titles are not unique at the database level, so skip existing ones
+        # with a single lookup instead of relying on ignore_conflicts.
+        existing = set(
+            GalleryImage.objects.filter(title__in=[entry[0] for entry in entries]).values_list("title", flat=True)
+        )
+        GalleryImage.objects.bulk_create(
+            [
+                GalleryImage(
+                    title=title,
+                    image=image,
+                    description=f"{title} capturing the craft process.",
+                    artisan=artisan,
+                    product=product,
+                    region=region,
+                    featured=featured,
+                )
+                for title, image, artisan, product, region, featured in entries
+                if title not in existing
+            ],
+            batch_size=BATCH_SIZE,
+        )
 
     def _create_orders(self, users, products):
         buyer1 = users["buyer1"]
         buyer2 = users["buyer2"]
 
-        order1, _ = Order.objects.get_or_create(
-            user=buyer1,
-            status="delivered",
-            defaults={
-                "total_amount": Decimal("4398.00"),
-                "shipping_address": "Jaipur Heritage Street, 302001",
-            },
-        )
-        order2, _ = Order.objects.get_or_create(
-            user=buyer2,
-            status="processing",
-            defaults={
-                "total_amount": Decimal("2799.00"),
-                "shipping_address": "Ahmedabad Craft Lane, 380001",
-            },
-        )
+        if Order.objects.filter(user__in=[buyer1, buyer2]).exists():
+            return
 
-        OrderItem.objects.get_or_create(
-            order=order1,
-            product=products[0],
-            defaults={"quantity": 1, "price": products[0].price},
+        order1, order2 = Order.objects.bulk_create(
+            [
+                Order(
+                    user=buyer1,
+                    status="delivered",
+                    shipping_address="Jaipur Heritage Street, 302001",
+                ),
+                Order(
+                    user=buyer2,
+                    status="processing",
+                    shipping_address="Ahmedabad Craft Lane, 380001",
+                ),
+            ]
         )
-        OrderItem.objects.get_or_create(
-            order=order1,
-            product=products[1],
-            defaults={"quantity": 1, "price": products[1].price},
-        )
-        OrderItem.objects.get_or_create(
-            order=order2,
-            product=products[5],
-            defaults={"quantity": 1, "price": products[5].price},
+        OrderItem.objects.bulk_create(
+            [
+                OrderItem(order=order, product=product, quantity=1, price=product.price)
+                for order, product in (
+                    (order1, products[0]),
+                    (order1, products[1]),
+                    (order2, products[5]),
+                )
+            ]
         )
 
     def _create_product_activity(self, sellers, products, users):
-        buyer1 = users["buyer1"]
-        buyer2 = users["buyer2"]
-        activity_types = ["view", "click", "add_cart", "purchase"]
+        buyers = [users["buyer1"], users["buyer2"]]
+        activity_types = [
+            ProductActivity.VIEW,
+            ProductActivity.CLICK,
+            ProductActivity.ADD_CART,
+            ProductActivity.PURCHASE,
+        ]
 
-        for product in products:
-            for _ in range(3):
-                ProductActivity.objects.create(
-                    seller=product.seller,
-                    product=product,
-                    activity_type=random.choice(activity_types),
-                    user=random.choice([buyer1, buyer2]),
-                    details={"source": "seed", "ref": "homepage"},
-                    created_at=timezone.now(),
-                )
+        # bulk_create skips save(), so the denormalized names are set here;
+        # created_at is filled in by auto_now_add during the insert.
+        activities = [
+            ProductActivity(
+                seller=product.seller,
+                product=product,
+                activity_type=random.choice(activity_types),
+                user=random.choice(buyers),
+                details={"source": "seed", "ref": "homepage"},
+                seller_shop_name=product.seller.shop_name,
+                product_name=product.name,
+            )
+            for product in products
+            for _ in range(3)
+        ]
+        ProductActivity.objects.bulk_create(activities, batch_size=BATCH_SIZE)
 
     def _create_newsletters(self, users):
-        Newsletter.objects.get_or_create(email=users["buyer1"].email)
-        Newsletter.objects.get_or_create(email=users["buyer2"].email)
+        for email in (users["buyer1"].email, users["buyer2"].email):
+            Newsletter.objects.get_or_create(email__lower=email.lower(), defaults={"email": email})
+
+    def _fetch_by_slug(self, model, slugs):
+        # bulk_create(ignore_conflicts=True) does not hand back primary keys
+        # for rows that already existed, so reload them in one query.
+        by_slug = model.objects.in_bulk(slugs, field_name="slug")
+        return [by_slug[slug] for slug in slugs]
@@ -0,0 +1,24 @@
+from django.contrib.auth import BACKEND_SESSION_KEY
+
+LEGACY_BACKEND = 'django.contrib.auth.backends.ModelBackend'
+PROFILE_BACKEND = 'kalakriti.backends.ProfileModelBackend'
+
+
+class ProfileBackendSessionMiddleware:
+    """Point sessions logged in through the stock ModelBackend at ProfileModelBackend.
+
+    AuthenticationMiddleware loads the session user through the backend
+    recorded at login, so without this, sessions created before
+    ProfileModelBackend existed would skip the profile join, and
+    ModelBackend would have to stay in AUTHENTICATION_BACKENDS, where it
+    checks every failed password a second time. Must come after
+    SessionMiddleware and before AuthenticationMiddleware.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        if request.session.get(BACKEND_SESSION_KEY) == LEGACY_BACKEND:
+            request.session[BACKEND_SESSION_KEY] = PROFILE_BACKEND
+        return self.get_response(request)
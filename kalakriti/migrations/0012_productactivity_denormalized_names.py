@@ -0,0 +1,35 @@
+# Generated by Django 6.0.2 on 2026-10-15 21:02
+
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+
+
+def backfill_names(apps, schema_editor):
+    ProductActivity = apps.get_model('kalakriti', 'ProductActivity')
+    Seller = apps.get_model('kalakriti', 'Seller')
+    Product = apps.get_model('kalakriti', 'Product')
+    ProductActivity.objects.update(
+        seller_shop_name=Subquery(Seller.objects.filter(pk=OuterRef('seller_id')).values('shop_name')[:1]),
+        product_name=Subquery(Product.objects.filter(pk=OuterRef('product_id')).values('name')[:1]),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('kalakriti', '0011_listing_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='productactivity',
+            name='product_name',
+            field=models.CharField(blank=True, max_length=200),
+        ),
+        migrations.AddField(
+            model_name='productactivity',
+            name='seller_shop_name',
+            field=models.CharField(blank=True, max_length=200),
+        ),
+        migrations.RunPython(backfill_names, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,35 @@
+from django.db import migrations
+
+BRIN_INDEX_NAME = 'productactivity_created_brin'
+
+
+def create_brin_index(apps, schema_editor):
+    # BRIN is PostgreSQL-specific; other backends keep the existing B-tree indexes.
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    ProductActivity = apps.get_model('kalakriti', 'ProductActivity')
+    quote_name = schema_editor.quote_name
+    schema_editor.execute(
+        'CREATE INDEX IF NOT EXISTS %s ON %s USING brin (%s) WITH (pages_per_range = 128)' % (
+            quote_name(BRIN_INDEX_NAME),
+            quote_name(ProductActivity._meta.db_table),
+            quote_name('created_at'),
+        )
+    )
+
+
+def drop_brin_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute('DROP INDEX IF EXISTS %s' % schema_editor.quote_name(BRIN_INDEX_NAME))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('kalakriti', '0012_productactivity_denormalized_names'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_brin_index, drop_brin_index),
+    ]
@@ -0,0 +1,68 @@
+# Generated by Django 6.0.2 on 2026-10-15 21:03
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+DETAILS_GIN_INDEX_NAME = 'act_details_gin'
+
+
+def copy_gallery_images(apps, schema_editor):
+    Product = apps.get_model('kalakriti', 'Product')
+    ProductGalleryImage = apps.get_model('kalakriti', 'ProductGalleryImage')
+    batch = []
+    for product in Product.objects.only('id', 'gallery_images').iterator(chunk_size=500):
+        batch.extend(
+            ProductGalleryImage(product_id=product.pk, image=image, position=position)
+            for position, image in enumerate(product.gallery_images or [])
+            if image
+        )
+        if len(batch) >= 500:
+            ProductGalleryImage.objects.bulk_create(batch)
+            batch = []
+    ProductGalleryImage.objects.bulk_create(batch)
+
+
+def create_details_gin_index(apps, schema_editor):
+    # JSONB containment lookups can only use a GIN index on PostgreSQL.
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    ProductActivity = apps.get_model('kalakriti', 'ProductActivity')
+    quote_name = schema_editor.quote_name
+    schema_editor.execute(
+        'CREATE INDEX IF NOT EXISTS %s ON %s USING gin (%s)' % (
+            quote_name(DETAILS_GIN_INDEX_NAME),
+            quote_name(ProductActivity._meta.db_table),
+            quote_name('details'),
+        )
+    )
+
+
+def drop_details_gin_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute('DROP INDEX IF EXISTS %s' % schema_editor.quote_name(DETAILS_GIN_INDEX_NAME))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('kalakriti', '0013_productactivity_created_brin'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ProductGalleryImage',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('image', models.ImageField(upload_to='products/')),
+                ('position', models.PositiveSmallIntegerField(default=0)),
+                ('product', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='gallery', to='kalakriti.product')),
+            ],
+            options={
+                'ordering': ['position'],
+                'unique_together': {('product', 'position')},
+            },
+        ),
+        migrations.RunPython(copy_gallery_images, migrations.RunPython.noop),
+        migrations.RunPython(create_details_gin_index, drop_details_gin_index),
+    ]
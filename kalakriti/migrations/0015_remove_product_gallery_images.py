@@ -0,0 +1,17 @@
+# Generated by Django 6.0.2 on 2026-10-15 21:04
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('kalakriti', '0014_productgalleryimage'),
+    ]
+
+    operations = [
+        migrations.RemoveField(
+            model_name='product',
+            name='gallery_images',
+        ),
+    ]
@@ -0,0 +1,34 @@
+# Generated by Django 6.0.2 on 2026-10-15 21:04
+
+import kalakriti.utils
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('kalakriti', '0015_remove_product_gallery_images'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='order',
+            name='id',
+            field=models.UUIDField(default=kalakriti.utils.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='orderitem',
+            name='id',
+            field=models.UUIDField(default=kalakriti.utils.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='productactivity',
+            name='id',
+            field=models.UUIDField(default=kalakriti.utils.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='storypost',
+            name='id',
+            field=models.UUIDField(default=kalakriti.utils.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+    ]
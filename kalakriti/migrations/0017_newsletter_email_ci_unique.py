@@ -0,0 +1,40 @@
+# Generated by Django 6.0.2 on 2026-10-15 21:05
+
+import django.db.models.functions.text
+from django.db import migrations, models
+from django.db.models.functions import Lower
+
+
+def remove_case_duplicates(apps, schema_editor):
+    # Keep the earliest subscription for each email, compared with the
+    # database's own LOWER() so it agrees with the constraint below.
+    Newsletter = apps.get_model('kalakriti', 'Newsletter')
+    seen = set()
+    duplicates = []
+    rows = (
+        Newsletter.objects.annotate(email_key=Lower('email'))
+        .order_by('subscribed_at', 'pk')
+        .values_list('pk', 'email_key')
+    )
+    for pk, email_key in rows.iterator():
+        if email_key in seen:
+            duplicates.append(pk)
+        else:
+            seen.add(email_key)
+    for start in range(0, len(duplicates), 500):
+        Newsletter.objects.filter(pk__in=duplicates[start:start + 500]).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('kalakriti', '0016_time_ordered_uuids'),
+    ]
+
+    operations = [
+        migrations.RunPython(remove_case_duplicates, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='newsletter',
+            constraint=models.UniqueConstraint(django.db.models.functions.text.Lower('email'), name='newsletter_email_ci_uniq'),
+        ),
+    ]
@@ -0,0 +1,77 @@
+# Generated by Django 6.0.2 on 2026-10-15 21:06
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+def fix_check_violations(apps, schema_editor):
+    """Bring existing rows within the new check constraints.
+
+    Ratings are clamped to 0-5 (before the column narrows to NUMERIC(3, 2))
+    and negative stock becomes 0. Non-positive prices and quantities have
+    no safe replacement value, so the migration stops and lists them.
+    """
+    Product = apps.get_model('kalakriti', 'Product')
+    Seller = apps.get_model('kalakriti', 'Seller')
+    SellerProduct = apps.get_model('kalakriti', 'SellerProduct')
+    OrderItem = apps.get_model('kalakriti', 'OrderItem')
+
+    bad_prices = list(Product.objects.filter(price__lte=0).values_list('slug', flat=True))
+    bad_quantities = list(OrderItem.objects.filter(quantity__lte=0).values_list('pk', flat=True))
+    if bad_prices or bad_quantities:
+        raise RuntimeError(
+            'Fix these rows before migrating: products with a price <= 0: %s; '
+            'order items with a quantity <= 0: %s.' % (bad_prices or 'none', bad_quantities or 'none')
+        )
+
+    for model in (Product, Seller):
+        model.objects.filter(rating__lt=0).update(rating=0)
+        model.objects.filter(rating__gt=5).update(rating=5)
+    Product.objects.filter(stock__lt=0).update(stock=0)
+    SellerProduct.objects.filter(seller_stock__lt=0).update(seller_stock=0)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('kalakriti', '0017_newsletter_email_ci_unique'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RunPython(fix_check_violations, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='product',
+            name='rating',
+            field=models.DecimalField(blank=True, decimal_places=2, default=0, max_digits=3),
+        ),
+        migrations.AlterField(
+            model_name='seller',
+            name='rating',
+            field=models.DecimalField(decimal_places=2, default=0, max_digits=3),
+        ),
+        migrations.AddConstraint(
+            model_name='orderitem',
+            constraint=models.CheckConstraint(condition=models.Q(('quantity__gt', 0)), name='orderitem_qty_pos'),
+        ),
+        migrations.AddConstraint(
+            model_name='product',
+            constraint=models.CheckConstraint(condition=models.Q(('rating__gte', 0), ('rating__lte', 5)), name='prod_rating_range'),
+        ),
+        migrations.AddConstraint(
+            model_name='product',
+            constraint=models.CheckConstraint(condition=models.Q(('stock__gte', 0)), name='prod_stock_nonneg'),
+        ),
+        migrations.AddConstraint(
+            model_name='product',
+            constraint=models.CheckConstraint(condition=models.Q(('price__gt', 0)), name='prod_price_pos'),
+        ),
+        migrations.AddConstraint(
+            model_name='seller',
+            constraint=models.CheckConstraint(condition=models.Q(('rating__gte', 0), ('rating__lte', 5)), name='seller_rating_range'),
+        ),
+        migrations.AddConstraint(
+            model_name='sellerproduct',
+            constraint=models.CheckConstraint(condition=models.Q(('seller_stock__gte', 0)), name='sp_stock_nonneg'),
+        ),
+    ]
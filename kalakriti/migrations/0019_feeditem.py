@@ -0,0 +1,58 @@
+# Generated by Django 6.0.2 on 2026-10-15 21:08
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def backfill_feed(apps, schema_editor):
+    StoryPost = apps.get_model('kalakriti', 'StoryPost')
+    FeedItem = apps.get_model('kalakriti', 'FeedItem')
+    UserProfile = apps.get_model('kalakriti', 'UserProfile')
+    posts = StoryPost.objects.select_related('user', 'mentioned_product', 'mentioned_artisan')
+    avatars = {
+        profile.user_id: profile.profile_image.url
+        for profile in UserProfile.objects.exclude(profile_image='').exclude(profile_image__isnull=True)
+    }
+    FeedItem.objects.bulk_create(
+        [
+            FeedItem(
+                post=post,
+                username=post.user.username,
+                avatar_url=avatars.get(post.user_id, ''),
+                content=post.content,
+                product_name=post.mentioned_product.name if post.mentioned_product else '',
+                product_slug=post.mentioned_product.slug if post.mentioned_product else '',
+                artisan_name=post.mentioned_artisan.name if post.mentioned_artisan else '',
+                created_at=post.created_at,
+            )
+            for post in posts.iterator()
+        ],
+        batch_size=500,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('kalakriti', '0018_decimal_ratings_and_checks'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='FeedItem',
+            fields=[
+                ('post', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='feed_item', serialize=False, to='kalakriti.storypost')),
+                ('username', models.CharField(max_length=150)),
+                ('avatar_url', models.CharField(blank=True, max_length=500)),
+                ('content', models.CharField(max_length=280)),
+                ('product_name', models.CharField(blank=True, max_length=200)),
+                ('product_slug', models.SlugField(blank=True)),
+                ('artisan_name', models.CharField(blank=True, max_length=200)),
+                ('created_at', models.DateTimeField(db_index=True)),
+            ],
+            options={
+                'ordering': ['-created_at'],
+            },
+        ),
+        migrations.RunPython(backfill_feed, migrations.RunPython.noop),
+    ]
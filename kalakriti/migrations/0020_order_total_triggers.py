@@ -0,0 +1,111 @@
+# Generated by Django 6.0.2 on 2026-10-15 21:09
+
+from django.db import migrations, models
+from django.db.models import F, OuterRef, Subquery, Sum
+from django.db.models.functions import Coalesce
+
+TRIGGER_FUNCTION = 'kalakriti_order_total'
+PG_TRIGGER = 'orderitem_total_trg'
+SQLITE_TRIGGERS = {
+    'orderitem_total_ins': ('INSERT', ('NEW',)),
+    'orderitem_total_upd': ('UPDATE', ('OLD', 'NEW')),
+    'orderitem_total_del': ('DELETE', ('OLD',)),
+}
+
+
+def _recompute_sql(apps, schema_editor, row):
+    """UPDATE recomputing the total of the order that ``row`` (NEW or OLD) belongs to."""
+    Order = apps.get_model('kalakriti', 'Order')
+    OrderItem = apps.get_model('kalakriti', 'OrderItem')
+    quote_name = schema_editor.quote_name
+    return (
+        'UPDATE {order} SET total_amount = COALESCE('
+        '(SELECT SUM(price * quantity) FROM {item} WHERE order_id = {row}.order_id), 0'
+        ') WHERE id = {row}.order_id;'
+    ).format(
+        order=quote_name(Order._meta.db_table),
+        item=quote_name(OrderItem._meta.db_table),
+        row=row,
+    )
+
+
+def recompute_totals(apps, schema_editor):
+    Order = apps.get_model('kalakriti', 'Order')
+    OrderItem = apps.get_model('kalakriti', 'OrderItem')
+    item_totals = (
+        OrderItem.objects.filter(order=OuterRef('pk'))
+        .order_by()
+        .values('order')
+        .annotate(total=Sum(F('price') * F('quantity')))
+        .values('total')
+    )
+    Order.objects.update(
+        total_amount=Coalesce(Subquery(item_totals), 0, output_field=models.DecimalField()),
+    )
+
+
+def create_triggers(apps, schema_editor):
+    # Triggers are written for PostgreSQL and SQLite only. SQLite drops a
+    # table's triggers when the schema editor rebuilds it, so any later
+    # migration that alters OrderItem must run create_triggers again.
+    OrderItem = apps.get_model('kalakriti', 'OrderItem')
+    item_table = schema_editor.quote_name(OrderItem._meta.db_table)
+    vendor = schema_editor.connection.vendor
+    if vendor == 'postgresql':
+        schema_editor.execute(
+            'CREATE OR REPLACE FUNCTION %s() RETURNS trigger AS $$\n'
+            'BEGIN\n'
+            "    IF TG_OP IN ('UPDATE', 'DELETE') THEN\n        %s\n    END IF;\n"
+            "    IF TG_OP IN ('INSERT', 'UPDATE') THEN\n        %s\n    END IF;\n"
+            '    RETURN NULL;\n'
+            'END;\n'
+            '$$ LANGUAGE plpgsql' % (
+                TRIGGER_FUNCTION,
+                _recompute_sql(apps, schema_editor, 'OLD'),
+                _recompute_sql(apps, schema_editor, 'NEW'),
+            )
+        )
+        schema_editor.execute('DROP TRIGGER IF EXISTS %s ON %s' % (PG_TRIGGER, item_table))
+        schema_editor.execute(
+            'CREATE TRIGGER %s AFTER INSERT OR UPDATE OR DELETE ON %s '
+            'FOR EACH ROW EXECUTE FUNCTION %s()' % (PG_TRIGGER, item_table, TRIGGER_FUNCTION)
+        )
+    elif vendor == 'sqlite':
+        for name, (event, rows) in SQLITE_TRIGGERS.items():
+            schema_editor.execute(
+                'CREATE TRIGGER IF NOT EXISTS %s AFTER %s ON %s BEGIN %s END' % (
+                    name,
+                    event,
+                    item_table,
+                    ' '.join(_recompute_sql(apps, schema_editor, row) for row in rows),
+                )
+            )
+    recompute_totals(apps, schema_editor)
+
+
+def drop_triggers(apps, schema_editor):
+    OrderItem = apps.get_model('kalakriti', 'OrderItem')
+    item_table = schema_editor.quote_name(OrderItem._meta.db_table)
+    vendor = schema_editor.connection.vendor
+    if vendor == 'postgresql':
+        schema_editor.execute('DROP TRIGGER IF EXISTS %s ON %s' % (PG_TRIGGER, item_table))
+        schema_editor.execute('DROP FUNCTION IF EXISTS %s()' % TRIGGER_FUNCTION)
+    elif vendor == 'sqlite':
+        for name in SQLITE_TRIGGERS:
+            schema_editor.execute('DROP TRIGGER IF EXISTS %s' % name)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('kalakriti', '0019_feeditem'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='order',
+            name='total_amount',
+            field=models.DecimalField(decimal_places=2, default=0, editable=False, max_digits=10),
+        ),
+        migrations.RunPython(create_triggers, drop_triggers),
+    ]
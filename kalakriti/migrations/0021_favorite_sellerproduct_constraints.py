@@ -0,0 +1,35 @@
+# Generated by Django 6.0.2 on 2026-10-15 21:10
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('kalakriti', '0020_order_total_triggers'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AlterUniqueTogether(
+            name='favorite',
+            unique_together=set(),
+        ),
+        migrations.AlterUniqueTogether(
+            name='sellerproduct',
+            unique_together=set(),
+        ),
+        migrations.AddIndex(
+            model_name='sellerproduct',
+            index=models.Index(fields=['seller', '-added_at'], name='sp_seller_added_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='favorite',
+            constraint=models.UniqueConstraint(fields=('user', 'product'), name='fav_user_prod_uniq'),
+        ),
+        migrations.AddConstraint(
+            model_name='sellerproduct',
+            constraint=models.UniqueConstraint(fields=('seller', 'product'), name='sp_seller_prod_uniq'),
+        ),
+    ]
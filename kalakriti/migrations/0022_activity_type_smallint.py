@@ -0,0 +1,68 @@
+# Generated by Django 6.0.2 on 2026-10-15 21:10
+
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Case, Value, When
+
+ACTIVITY_CODES = {'view': 0, 'click': 1, 'add_cart': 2, 'purchase': 3, 'review': 4}
+
+
+def encode_activity_types(apps, schema_editor):
+    ProductActivity = apps.get_model('kalakriti', 'ProductActivity')
+    ProductActivity.objects.update(
+        activity_type_code=Case(
+            *[When(activity_type=name, then=Value(code)) for name, code in ACTIVITY_CODES.items()],
+            default=Value(0),
+        )
+    )
+
+
+def decode_activity_types(apps, schema_editor):
+    ProductActivity = apps.get_model('kalakriti', 'ProductActivity')
+    ProductActivity.objects.update(
+        activity_type=Case(
+            *[When(activity_type_code=code, then=Value(name)) for name, code in ACTIVITY_CODES.items()],
+            default=Value('view'),
+        )
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('kalakriti', '0021_favorite_sellerproduct_constraints'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='productactivity',
+            name='activity_type_code',
+            field=models.PositiveSmallIntegerField(null=True),
+        ),
+        # Nullable so the column can be re-added empty when unapplying.
+        migrations.AlterField(
+            model_name='productactivity',
+            name='activity_type',
+            field=models.CharField(choices=[('view', 'Product Viewed'), ('click', 'Product Clicked'), ('add_cart', 'Added to Cart'), ('purchase', 'Purchased'), ('review', 'Review Added')], max_length=20, null=True),
+        ),
+        migrations.RunPython(encode_activity_types, decode_activity_types),
+        migrations.RemoveField(
+            model_name='productactivity',
+            name='activity_type',
+        ),
+        migrations.RenameField(
+            model_name='productactivity',
+            old_name='activity_type_code',
+            new_name='activity_type',
+        ),
+        migrations.AlterField(
+            model_name='productactivity',
+            name='activity_type',
+            field=models.PositiveSmallIntegerField(choices=[(0, 'Product Viewed'), (1, 'Product Clicked'), (2, 'Added to Cart'), (3, 'Purchased'), (4, 'Review Added')]),
+        ),
+        migrations.AddIndex(
+            model_name='productactivity',
+            index=models.Index(fields=['seller', 'activity_type', 'created_at'], name='act_seller_type_created_idx'),
+        ),
+    ]
@@ -0,0 +1,43 @@
+from django.db import migrations
+
+TRIGRAM_INDEXES = {
+    'prod_name_trgm': 'name',
+    'prod_desc_trgm': 'description',
+}
+
+
+def create_trigram_indexes(apps, schema_editor):
+    # Superseded by the UPPER() expression indexes in 0027, which are the
+    # ones Django's icontains lookups can use. Other backends keep scanning
+    # the table.
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    Product = apps.get_model('kalakriti', 'Product')
+    quote_name = schema_editor.quote_name
+    schema_editor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    for index_name, column in TRIGRAM_INDEXES.items():
+        schema_editor.execute(
+            'CREATE INDEX IF NOT EXISTS %s ON %s USING gin (%s gin_trgm_ops)' % (
+                quote_name(index_name),
+                quote_name(Product._meta.db_table),
+                quote_name(column),
+            )
+        )
+
+
+def drop_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for index_name in TRIGRAM_INDEXES:
+        schema_editor.execute('DROP INDEX IF EXISTS %s' % schema_editor.quote_name(index_name))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('kalakriti', '0022_activity_type_smallint'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_trigram_indexes, drop_trigram_indexes),
+    ]
@@ -0,0 +1,45 @@
+# Generated by Django 6.0.2 on 2026-10-15 21:12
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('kalakriti', '0023_product_trigram_indexes'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='galleryimage',
+            name='artisan',
+            field=models.ForeignKey(blank=True, db_index=False, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='gallery_images', to='kalakriti.artisan'),
+        ),
+        migrations.AlterField(
+            model_name='galleryimage',
+            name='product',
+            field=models.ForeignKey(blank=True, db_index=False, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='gallery_items', to='kalakriti.product'),
+        ),
+        migrations.AlterField(
+            model_name='galleryimage',
+            name='region',
+            field=models.ForeignKey(blank=True, db_index=False, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='gallery_images', to='kalakriti.region'),
+        ),
+        migrations.AddIndex(
+            model_name='galleryimage',
+            index=models.Index(condition=models.Q(('artisan__isnull', False)), fields=['artisan', '-created_at'], name='gi_artisan_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='galleryimage',
+            index=models.Index(condition=models.Q(('product__isnull', False)), fields=['product', '-created_at'], name='gi_product_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='galleryimage',
+            index=models.Index(condition=models.Q(('region__isnull', False)), fields=['region', '-created_at'], name='gi_region_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='galleryimage',
+            constraint=models.CheckConstraint(condition=models.Q(models.Q(('artisan__isnull', False), ('product__isnull', True), ('region__isnull', True)), models.Q(('artisan__isnull', True), ('product__isnull', False), ('region__isnull', True)), models.Q(('artisan__isnull', True), ('product__isnull', True), ('region__isnull', False)), _connector='OR'), name='gi_single_owner', violation_error_message='A gallery image must belong to exactly one artisan, product or region.'),
+        ),
+    ]
@@ -0,0 +1,36 @@
+# Generated by Django 6.0.2 on 2026-10-15 21:21
+
+from django.db import migrations, models
+
+
+def backfill_avatars(apps, schema_editor):
+    FeedItem = apps.get_model('kalakriti', 'FeedItem')
+    UserProfile = apps.get_model('kalakriti', 'UserProfile')
+    profiles = UserProfile.objects.exclude(profile_image='').exclude(profile_image__isnull=True)
+    for user_id, profile_image in profiles.values_list('user_id', 'profile_image').iterator():
+        FeedItem.objects.filter(post__user_id=user_id).update(avatar=profile_image)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('kalakriti', '0024_galleryimage_owner_indexes'),
+    ]
+
+    operations = [
+        migrations.RemoveField(
+            model_name='feeditem',
+            name='avatar_url',
+        ),
+        migrations.AddField(
+            model_name='feeditem',
+            name='avatar',
+            field=models.ImageField(blank=True, upload_to='profiles/'),
+        ),
+        migrations.AlterField(
+            model_name='feeditem',
+            name='content',
+            field=models.TextField(max_length=280),
+        ),
+        migrations.RunPython(backfill_avatars, migrations.RunPython.noop),
+    ]
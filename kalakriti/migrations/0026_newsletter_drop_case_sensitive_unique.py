@@ -0,0 +1,18 @@
+# Generated by Django 6.0.2 on 2026-10-15 21:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('kalakriti', '0025_feeditem_avatar_file'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='newsletter',
+            name='email',
+            field=models.EmailField(max_length=254),
+        ),
+    ]
@@ -0,0 +1,49 @@
+from django.db import migrations
+
+# On PostgreSQL, name__icontains compiles to UPPER("name"::text) LIKE
+# UPPER(%s). The planner only uses an index built on that same expression,
+# so the plain column indexes from 0023 are replaced.
+OLD_INDEXES = {
+    'prod_name_trgm': 'name',
+    'prod_desc_trgm': 'description',
+}
+UPPER_INDEXES = {
+    'prod_name_upper_trgm': 'name',
+    'prod_desc_upper_trgm': 'description',
+}
+
+
+def _swap_indexes(apps, schema_editor, drop, create, expression):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    Product = apps.get_model('kalakriti', 'Product')
+    quote_name = schema_editor.quote_name
+    for index_name in drop:
+        schema_editor.execute('DROP INDEX IF EXISTS %s' % quote_name(index_name))
+    for index_name, column in create.items():
+        schema_editor.execute(
+            'CREATE INDEX IF NOT EXISTS %s ON %s USING gin ((%s) gin_trgm_ops)' % (
+                quote_name(index_name),
+                quote_name(Product._meta.db_table),
+                expression % quote_name(column),
+            )
+        )
+
+
+def create_upper_indexes(apps, schema_editor):
+    _swap_indexes(apps, schema_editor, OLD_INDEXES, UPPER_INDEXES, 'UPPER(%s::text)')
+
+
+def restore_column_indexes(apps, schema_editor):
+    _swap_indexes(apps, schema_editor, UPPER_INDEXES, OLD_INDEXES, '%s')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('kalakriti', '0026_newsletter_drop_case_sensitive_unique'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_upper_indexes, restore_column_indexes),
+    ]
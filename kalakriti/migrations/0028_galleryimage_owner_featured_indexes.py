@@ -0,0 +1,37 @@
+# Generated by Django 6.0.2 on 2026-10-15 21:34
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('kalakriti', '0027_product_trigram_upper_indexes'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='galleryimage',
+            name='gi_artisan_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='galleryimage',
+            name='gi_product_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='galleryimage',
+            name='gi_region_idx',
+        ),
+        migrations.AddIndex(
+            model_name='galleryimage',
+            index=models.Index(condition=models.Q(('artisan__isnull', False)), fields=['artisan', '-featured', '-created_at'], name='gi_artisan_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='galleryimage',
+            index=models.Index(condition=models.Q(('product__isnull', False)), fields=['product', '-featured', '-created_at'], name='gi_product_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='galleryimage',
+            index=models.Index(condition=models.Q(('region__isnull', False)), fields=['region', '-featured', '-created_at'], name='gi_region_idx'),
+        ),
+    ]
@@ -1,8 +1,14 @@
-from django.db import models
+from django.db import connections, models
+from django.db.models.functions import Lower
 from django.contrib.auth.models import User
 from django.utils import timezone
 import uuid
 
+from .caching import cached_queryset, versioned_get_or_set
+from .utils import uuid7
+
+FEATURED_CACHE_TIMEOUT = 900
+
 
 class UserProfile(models.Model):
     """Extended User Profile for Buyer/Seller"""
@@ -45,7 +51,7 @@ class Seller(models.Model):
     ifsc_code = models.CharField(max_length=11, blank=True)
     total_products = models.IntegerField(default=0)
     total_sales = models.DecimalField(max_digits=12, decimal_places=2, default=0)
-    rating = models.FloatField(default=0)
+    rating = models.DecimalField(max_digits=3, decimal_places=2, default=0)
     is_verified = models.BooleanField(default=False)
     is_active = models.BooleanField(default=True)
     created_at = models.DateTimeField(auto_now_add=True)
@@ -56,6 +62,16 @@ class Seller(models.Model):
     
     class Meta:
         ordering = ['-created_at']
+        constraints = [
+            models.CheckConstraint(
+                condition=models.Q(rating__gte=0) & models.Q(rating__lte=5), name='seller_rating_range',
+            ),
+        ]
+
+
+class SellerProductManager(models.Manager):
+    def get_queryset(self):
+        return super().get_queryset().select_related('seller', 'product')
 
 
 class SellerProduct(models.Model):
@@ -68,45 +84,77 @@ class SellerProduct(models.Model):
     added_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     
+    objects = SellerProductManager()
+    lean = models.Manager()
+    
     def __str__(self):
         return f"{self.seller.shop_name} - {self.product.name}"
     
     class Meta:
-        unique_together = ('seller', 'product')
         ordering = ['-added_at']
+        indexes = [
+            models.Index(fields=['seller', '-added_at'], name='sp_seller_added_idx'),
+        ]
+        constraints = [
+            models.UniqueConstraint(fields=['seller', 'product'], name='sp_seller_prod_uniq'),
+            models.CheckConstraint(condition=models.Q(seller_stock__gte=0), name='sp_stock_nonneg'),
+        ]
 
 
 class ProductActivity(models.Model):
     """Track product activities - views, clicks, sales"""
+    VIEW, CLICK, ADD_CART, PURCHASE, REVIEW = range(5)
     ACTIVITY_TYPES = [
-        ('view', 'Product Viewed'),
-        ('click', 'Product Clicked'),
-        ('add_cart', 'Added to Cart'),
-        ('purchase', 'Purchased'),
-        ('review', 'Review Added'),
+        (VIEW, 'Product Viewed'),
+        (CLICK, 'Product Clicked'),
+        (ADD_CART, 'Added to Cart'),
+        (PURCHASE, 'Purchased'),
+        (REVIEW, 'Review Added'),
     ]
     
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     seller = models.ForeignKey(Seller, on_delete=models.CASCADE, related_name='activities')
     product = models.ForeignKey('Product', on_delete=models.CASCADE, related_name='activities')
-    activity_type = models.CharField(max_length=20, choices=ACTIVITY_TYPES)
+    activity_type = models.PositiveSmallIntegerField(choices=ACTIVITY_TYPES)
     user = models.ForeignKey(User, on_delete=models.SET_NULL, null=True, blank=True)
     details = models.JSONField(default=dict, blank=True)
+    # Copied from the seller and product at insert time so activity feeds
+    # can be listed without joining either table.
+    seller_shop_name = models.CharField(max_length=200, blank=True)
+    product_name = models.CharField(max_length=200, blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
     
     def __str__(self):
-        return f"{self.seller.shop_name} - {self.get_activity_type_display()}"
+        return f"{self.seller_shop_name} - {self.get_activity_type_display()}"
+    
+    def save(self, *args, **kwargs):
+        if self._state.adding:
+            self.seller_shop_name = self.seller.shop_name
+            self.product_name = self.product.name
+        super().save(*args, **kwargs)
+    
+    @classmethod
+    def stream_for_report(cls, seller_id, since):
+        """Yield a seller's activity since ``since`` as dicts, in chunks, without building model instances."""
+        return (
+            cls.objects.filter(seller_id=seller_id, created_at__gte=since)
+            .values('product_id', 'activity_type', 'created_at')
+            .iterator(chunk_size=2000)
+        )
     
     class Meta:
         ordering = ['-created_at']
         indexes = [
             models.Index(fields=['seller', '-created_at']),
             models.Index(fields=['product', '-created_at']),
+            models.Index(fields=['seller', 'activity_type', 'created_at'], name='act_seller_type_created_idx'),
         ]
 
 
 class Category(models.Model):
     """Product Category Model"""
+    CACHE_VERSION_KEY = 'categories:version'
+    
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     name = models.CharField(max_length=200)
     slug = models.SlugField(unique=True)
@@ -117,6 +165,11 @@ class Category(models.Model):
     def __str__(self):
         return self.name
     
+    @classmethod
+    def all_cached(cls):
+        """All categories, cached until any category is saved or deleted."""
+        return versioned_get_or_set(cls.CACHE_VERSION_KEY, 'categories', lambda: list(cls.objects.all()), 3600)
+    
     class Meta:
         ordering = ['name']
         verbose_name_plural = 'Categories'
@@ -124,6 +177,8 @@ class Category(models.Model):
 
 class Region(models.Model):
     """Indian Region/State Model"""
+    CACHE_VERSION_KEY = 'regions:version'
+    
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     name = models.CharField(max_length=200)
     slug = models.SlugField(unique=True)
@@ -135,12 +190,19 @@ class Region(models.Model):
     def __str__(self):
         return self.name
     
+    @classmethod
+    def all_cached(cls):
+        """All regions, cached until any region is saved or deleted."""
+        return versioned_get_or_set(cls.CACHE_VERSION_KEY, 'regions', lambda: list(cls.objects.all()), 3600)
+    
     class Meta:
         ordering = ['name']
 
 
 class Artisan(models.Model):
     """Artisan/Craftsperson Model"""
+    CACHE_VERSION_KEY = 'artisans:version'
+    
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     name = models.CharField(max_length=200)
     slug = models.SlugField(unique=True)
@@ -160,46 +222,133 @@ class Artisan(models.Model):
     def __str__(self):
         return self.name
     
+    @classmethod
+    def featured_cached(cls, limit=8):
+        return cached_queryset(
+            cls.objects.select_related('region').filter(featured=True)[:limit],
+            FEATURED_CACHE_TIMEOUT,
+            cls.CACHE_VERSION_KEY,
+        )
+    
     class Meta:
         ordering = ['-featured', '-created_at']
 
 
+class ProductQuerySet(models.QuerySet):
+    def with_relations(self):
+        return self.select_related('category', 'region', 'artisan', 'seller')
+    
+    def listing(self):
+        """Load only the columns product cards render, leaving description unread."""
+        return self.select_related(None).select_related('category').only(
+            'id', 'slug', 'name', 'price', 'original_price', 'image', 'rating', 'in_stock', 'category__name',
+        )
+    
+    def search(self, query):
+        """Products whose name or description contains ``query``.
+
+        On PostgreSQL the match is served by the trigram indexes and results
+        are ranked by how closely the name resembles the query.
+        """
+        matches = self.filter(models.Q(name__icontains=query) | models.Q(description__icontains=query))
+        if connections[self.db].vendor != 'postgresql':
+            return matches
+        from django.contrib.postgres.search import TrigramSimilarity
+        return matches.annotate(similarity=TrigramSimilarity('name', query)).order_by('-similarity')
+
+
+class ProductManager(models.Manager.from_queryset(ProductQuerySet)):
+    def get_queryset(self):
+        return super().get_queryset().with_relations()
+
+
 class Product(models.Model):
     """Product Model"""
+    CACHE_VERSION_KEY = 'products:version'
+    
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     name = models.CharField(max_length=200)
     slug = models.SlugField(unique=True)
     description = models.TextField()
-    category = models.ForeignKey(Category, on_delete=models.SET_NULL, null=True, related_name='products')
+    # Indexed by prod_cat_created_idx, which leads with category.
+    category = models.ForeignKey(
+        Category, on_delete=models.SET_NULL, null=True, related_name='products', db_index=False,
+    )
     region = models.ForeignKey(Region, on_delete=models.SET_NULL, null=True, blank=True, related_name='products')
     artisan = models.ForeignKey(Artisan, on_delete=models.SET_NULL, null=True, blank=True, related_name='products')
-    seller = models.ForeignKey(Seller, on_delete=models.SET_NULL, null=True, blank=True, related_name='products')
+    # Indexed by prod_seller_created_idx, which leads with seller.
+    seller = models.ForeignKey(
+        Seller, on_delete=models.SET_NULL, null=True, blank=True, related_name='products', db_index=False,
+    )
     price = models.DecimalField(max_digits=10, decimal_places=2)
     original_price = models.DecimalField(max_digits=10, decimal_places=2, blank=True, null=True)
     stock = models.IntegerField(default=0)
     image = models.ImageField(upload_to='products/')
-    gallery_images = models.JSONField(default=list, blank=True)
     featured = models.BooleanField(default=False)
     in_stock = models.BooleanField(default=True)
-    rating = models.FloatField(default=0, blank=True)
+    rating = models.DecimalField(max_digits=3, decimal_places=2, default=0, blank=True)
     reviews_count = models.IntegerField(default=0)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     
+    objects = ProductManager()
+    lean = ProductQuerySet.as_manager()
+    
     def __str__(self):
         return self.name
     
+    @classmethod
+    def featured_cached(cls, limit=8):
+        return cached_queryset(
+            cls.objects.listing().filter(featured=True)[:limit],
+            FEATURED_CACHE_TIMEOUT,
+            cls.CACHE_VERSION_KEY,
+        )
+    
     class Meta:
         ordering = ['-created_at']
         indexes = [
             models.Index(fields=['slug']),
-            models.Index(fields=['category']),
             models.Index(fields=['region']),
+            models.Index(fields=['featured', 'in_stock', '-created_at'], name='product_feat_stock_idx'),
+            # featured_cached() orders by created_at without filtering on
+            # in_stock, which product_feat_stock_idx cannot return in order.
+            models.Index(fields=['featured', '-created_at'], name='prod_feat_created_idx'),
+            models.Index(fields=['category', '-created_at'], name='prod_cat_created_idx'),
+            models.Index(fields=['seller', '-created_at'], name='prod_seller_created_idx'),
+            models.Index(
+                fields=['-created_at'],
+                name='prod_instock_created_idx',
+                condition=models.Q(in_stock=True),
+            ),
+        ]
+        constraints = [
+            models.CheckConstraint(
+                condition=models.Q(rating__gte=0) & models.Q(rating__lte=5), name='prod_rating_range',
+            ),
+            models.CheckConstraint(condition=models.Q(stock__gte=0), name='prod_stock_nonneg'),
+            models.CheckConstraint(condition=models.Q(price__gt=0), name='prod_price_pos'),
         ]
 
 
+class ProductGalleryImage(models.Model):
+    """Additional Product Image, ordered by position"""
+    product = models.ForeignKey(Product, on_delete=models.CASCADE, related_name='gallery')
+    image = models.ImageField(upload_to='products/')
+    position = models.PositiveSmallIntegerField(default=0)
+    
+    def __str__(self):
+        return f"{self.product.name} #{self.position}"
+    
+    class Meta:
+        ordering = ['position']
+        unique_together = ('product', 'position')
+
+
 class CulturalStory(models.Model):
     """Cultural Heritage Story Model"""
+    CACHE_VERSION_KEY = 'stories:version'
+    
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     title = models.CharField(max_length=300)
     slug = models.SlugField(unique=True)
@@ -215,14 +364,27 @@ class CulturalStory(models.Model):
     def __str__(self):
         return self.title
     
+    @classmethod
+    def published_cached(cls, limit=6):
+        return cached_queryset(
+            cls.objects.select_related('region').filter(published=True)[:limit],
+            FEATURED_CACHE_TIMEOUT,
+            cls.CACHE_VERSION_KEY,
+        )
+    
     class Meta:
         ordering = ['-created_at']
         verbose_name_plural = 'Cultural Stories'
 
 
+class StoryPostManager(models.Manager):
+    def get_queryset(self):
+        return super().get_queryset().select_related('user', 'mentioned_product', 'mentioned_artisan')
+
+
 class StoryPost(models.Model):
     """Social-style story feed posts with optional mentions."""
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='story_posts')
     content = models.TextField(max_length=280)
     mentioned_product = models.ForeignKey(
@@ -242,6 +404,9 @@ class StoryPost(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = StoryPostManager()
+    lean = models.Manager()
+
     def __str__(self):
         return f"{self.user.username}: {self.content[:40]}"
 
@@ -253,23 +418,121 @@ class StoryPost(models.Model):
         ]
 
 
+class FeedItem(models.Model):
+    """Denormalized copy of a StoryPost holding everything the feed renders"""
+    post = models.OneToOneField(StoryPost, on_delete=models.CASCADE, primary_key=True, related_name='feed_item')
+    username = models.CharField(max_length=150)
+    # The file name, not a URL, so the URL follows MEDIA_URL at render time.
+    avatar = models.ImageField(upload_to='profiles/', blank=True)
+    content = models.TextField(max_length=280)
+    product_name = models.CharField(max_length=200, blank=True)
+    product_slug = models.SlugField(blank=True)
+    artisan_name = models.CharField(max_length=200, blank=True)
+    created_at = models.DateTimeField(db_index=True)
+
+    def __str__(self):
+        return f"{self.username}: {self.content[:40]}"
+
+    @property
+    def avatar_url(self):
+        return self.avatar.url if self.avatar else ''
+
+    @classmethod
+    def from_post(cls, post):
+        try:
+            profile_image = post.user.profile.profile_image
+        except UserProfile.DoesNotExist:
+            profile_image = None
+        product = post.mentioned_product
+        artisan = post.mentioned_artisan
+        return cls(
+            post=post,
+            username=post.user.username,
+            avatar=profile_image.name if profile_image else '',
+            content=post.content,
+            product_name=product.name if product else '',
+            product_slug=product.slug if product else '',
+            artisan_name=artisan.name if artisan else '',
+            created_at=post.created_at,
+        )
+
+    @classmethod
+    def latest(cls, limit=50):
+        return cls.objects.order_by('-created_at')[:limit]
+
+    class Meta:
+        ordering = ['-created_at']
+
+
 class GalleryImage(models.Model):
     """Gallery Image Model"""
+    CACHE_VERSION_KEY = 'gallery:version'
+    
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     title = models.CharField(max_length=200)
     image = models.ImageField(upload_to='gallery/')
     description = models.TextField(blank=True)
-    artisan = models.ForeignKey(Artisan, on_delete=models.CASCADE, related_name='gallery_images', blank=True, null=True)
-    product = models.ForeignKey(Product, on_delete=models.CASCADE, related_name='gallery_items', blank=True, null=True)
-    region = models.ForeignKey(Region, on_delete=models.CASCADE, related_name='gallery_images', blank=True, null=True)
+    # Exactly one owner is set; each is indexed by a partial index in Meta
+    # rather than a full index that is mostly NULLs. The indexes follow the
+    # default ordering, so an owner's images come back without a sort.
+    artisan = models.ForeignKey(
+        Artisan, on_delete=models.CASCADE, related_name='gallery_images', blank=True, null=True, db_index=False,
+    )
+    product = models.ForeignKey(
+        Product, on_delete=models.CASCADE, related_name='gallery_items', blank=True, null=True, db_index=False,
+    )
+    region = models.ForeignKey(
+        Region, on_delete=models.CASCADE, related_name='gallery_images', blank=True, null=True, db_index=False,
+    )
     created_at = models.DateTimeField(auto_now_add=True)
     featured = models.BooleanField(default=False)
     
     def __str__(self):
         return self.title
     
+    @classmethod
+    def featured_cached(cls, limit=8):
+        return cached_queryset(
+            cls.objects.filter(featured=True)[:limit],
+            FEATURED_CACHE_TIMEOUT,
+            cls.CACHE_VERSION_KEY,
+        )
+    
     class Meta:
         ordering = ['-featured', '-created_at']
+        indexes = [
+            models.Index(
+                fields=['artisan', '-featured', '-created_at'],
+                name='gi_artisan_idx',
+                condition=models.Q(artisan__isnull=False),
+            ),
+            models.Index(
+                fields=['product', '-featured', '-created_at'],
+                name='gi_product_idx',
+                condition=models.Q(product__isnull=False),
+            ),
+            models.Index(
+                fields=['region', '-featured', '-created_at'],
+                name='gi_region_idx',
+                condition=models.Q(region__isnull=False),
+            ),
+        ]
+        constraints = [
+            models.CheckConstraint(
+                condition=(
+                    models.Q(artisan__isnull=False, product__isnull=True, region__isnull=True)
+                    | models.Q(artisan__isnull=True, product__isnull=False, region__isnull=True)
+                    | models.Q(artisan__isnull=True, product__isnull=True, region__isnull=False)
+                ),
+                name='gi_single_owner',
+                violation_error_message='A gallery image must belong to exactly one artisan, product or region.',
+            ),
+        ]
+
+
+class OrderManager(models.Manager):
+    def get_queryset(self):
+        return super().get_queryset().select_related('user')
 
 
 class Order(models.Model):
@@ -282,24 +545,45 @@ class Order(models.Model):
         ('cancelled', 'Cancelled'),
     ]
     
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='orders')
-    total_amount = models.DecimalField(max_digits=10, decimal_places=2)
+    # Kept equal to the sum of the order's items by database triggers on
+    # OrderItem (see migration 0020), never by application code.
+    total_amount = models.DecimalField(max_digits=10, decimal_places=2, default=0, editable=False)
     status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='pending')
     shipping_address = models.TextField()
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     
+    objects = OrderManager()
+    lean = models.Manager()
+    
     def __str__(self):
         return f"Order {self.id} - {self.user.email}"
     
+    def save(self, *args, **kwargs):
+        # Don't write back a total_amount that the triggers may have changed
+        # since this instance was loaded, and leave deferred fields alone
+        # like a plain save() would.
+        if not self._state.adding and kwargs.get('update_fields') is None:
+            skipped = self.get_deferred_fields() | {'total_amount'}
+            kwargs['update_fields'] = [
+                field.name for field in self._meta.concrete_fields
+                if not field.primary_key and field.attname not in skipped
+            ]
+        super().save(*args, **kwargs)
+    
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['status', '-created_at'], name='order_status_created_idx'),
+            models.Index(fields=['user', '-created_at'], name='order_user_created_idx'),
+        ]
 
 
 class OrderItem(models.Model):
     """Order Item Model"""
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     order = models.ForeignKey(Order, on_delete=models.CASCADE, related_name='items')
     product = models.ForeignKey(Product, on_delete=models.CASCADE)
     quantity = models.IntegerField()
@@ -307,11 +591,21 @@ class OrderItem(models.Model):
     
     def __str__(self):
         return f"{self.product.name} x {self.quantity}"
+    
+    class Meta:
+        constraints = [
+            models.CheckConstraint(condition=models.Q(quantity__gt=0), name='orderitem_qty_pos'),
+        ]
+
+
+# Lets email__lower=... compile to LOWER(email) = ..., which the
+# newsletter_email_ci_uniq expression index can serve; iexact cannot use it.
+models.EmailField.register_lookup(Lower)
 
 
 class Newsletter(models.Model):
     """Newsletter Subscription Model"""
-    email = models.EmailField(unique=True)
+    email = models.EmailField()
     subscribed_at = models.DateTimeField(auto_now_add=True)
     
     def __str__(self):
@@ -319,6 +613,9 @@ class Newsletter(models.Model):
     
     class Meta:
         ordering = ['-subscribed_at']
+        constraints = [
+            models.UniqueConstraint(Lower('email'), name='newsletter_email_ci_uniq'),
+        ]
 
 
 class Favorite(models.Model):
@@ -331,8 +628,13 @@ class Favorite(models.Model):
         return f"{self.user.email} - {self.product.name}"
     
     class Meta:
-        unique_together = ('user', 'product')
         ordering = ['-created_at']
         verbose_name_plural = 'Favorites'
+        indexes = [
+            models.Index(fields=['user', '-created_at'], name='fav_user_created_idx'),
+        ]
+        constraints = [
+            models.UniqueConstraint(fields=['user', 'product'], name='fav_user_prod_uniq'),
+        ]
 
 
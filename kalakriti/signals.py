@@ -0,0 +1,123 @@
+from django.contrib.auth.models import User
+from django.db.models.signals import post_delete, post_save, pre_delete, pre_save
+from django.dispatch import receiver
+
+from .caching import bump_version
+from .models import (
+    Artisan, Category, CulturalStory, FeedItem, GalleryImage, Product, ProductActivity, Region, Seller, StoryPost,
+    UserProfile,
+)
+
+
+def _changed_fields(sender, instance, fields, update_fields):
+    """Return the subset of ``fields`` about to change on an existing row."""
+    if instance._state.adding:
+        return set()
+    if update_fields is not None:
+        fields = [field for field in fields if field in update_fields]
+    if not fields:
+        return set()
+    previous = sender._base_manager.filter(pk=instance.pk).values(*fields).first()
+    if previous is None:
+        return set()
+    return {field for field in fields if previous[field] != getattr(instance, field)}
+
+
+@receiver(pre_save, sender=Seller)
+def track_shop_name_change(sender, instance, update_fields=None, **kwargs):
+    instance._changed_fields = _changed_fields(sender, instance, ['shop_name'], update_fields)
+
+
+@receiver(post_save, sender=Seller)
+def sync_activity_shop_name(sender, instance, created, **kwargs):
+    if 'shop_name' in getattr(instance, '_changed_fields', ()):
+        ProductActivity.objects.filter(seller=instance).update(seller_shop_name=instance.shop_name)
+
+
+@receiver(pre_save, sender=Product)
+def track_product_changes(sender, instance, update_fields=None, **kwargs):
+    instance._changed_fields = _changed_fields(sender, instance, ['name', 'slug'], update_fields)
+
+
+@receiver(post_save, sender=Product)
+def sync_activity_product_name(sender, instance, created, **kwargs):
+    if 'name' in getattr(instance, '_changed_fields', ()):
+        ProductActivity.objects.filter(product=instance).update(product_name=instance.name)
+
+
+# FeedItem copies values from the post's author, profile and mentions, so
+# each of those keeps its copies current when it is renamed or deleted.
+
+@receiver(post_save, sender=StoryPost)
+def project_feed_item(sender, instance, **kwargs):
+    FeedItem.from_post(instance).save()
+
+
+@receiver(pre_save, sender=User)
+def track_username_change(sender, instance, update_fields=None, **kwargs):
+    instance._changed_fields = _changed_fields(sender, instance, ['username'], update_fields)
+
+
+@receiver(post_save, sender=User)
+def sync_feed_username(sender, instance, created, **kwargs):
+    if 'username' in getattr(instance, '_changed_fields', ()):
+        FeedItem.objects.filter(post__user=instance).update(username=instance.username)
+
+
+@receiver(pre_save, sender=UserProfile)
+def track_profile_image_change(sender, instance, update_fields=None, **kwargs):
+    instance._changed_fields = _changed_fields(sender, instance, ['profile_image'], update_fields)
+
+
+@receiver(post_save, sender=UserProfile)
+def sync_feed_avatar(sender, instance, created, **kwargs):
+    if created or 'profile_image' in getattr(instance, '_changed_fields', ()):
+        avatar = instance.profile_image.name if instance.profile_image else ''
+        FeedItem.objects.filter(post__user_id=instance.user_id).update(avatar=avatar)
+
+
+@receiver(post_delete, sender=UserProfile)
+def clear_feed_avatar(sender, instance, **kwargs):
+    FeedItem.objects.filter(post__user_id=instance.user_id).update(avatar='')
+
+
+@receiver(post_save, sender=Product)
+def sync_feed_product(sender, instance, created, **kwargs):
+    changed = getattr(instance, '_changed_fields', set()) & {'name', 'slug'}
+    if changed:
+        FeedItem.objects.filter(post__mentioned_product=instance).update(
+            product_name=instance.name, product_slug=instance.slug,
+        )
+
+
+@receiver(pre_delete, sender=Product)
+def clear_feed_product(sender, instance, **kwargs):
+    # Runs before the SET_NULL on StoryPost, which is a bulk UPDATE that
+    # sends no post_save, while the posts still point at the product.
+    FeedItem.objects.filter(post__mentioned_product=instance).update(product_name='', product_slug='')
+
+
+@receiver(pre_save, sender=Artisan)
+def track_artisan_name_change(sender, instance, update_fields=None, **kwargs):
+    instance._changed_fields = _changed_fields(sender, instance, ['name'], update_fields)
+
+
+@receiver(post_save, sender=Artisan)
+def sync_feed_artisan(sender, instance, created, **kwargs):
+    if 'name' in getattr(instance, '_changed_fields', ()):
+        FeedItem.objects.filter(post__mentioned_artisan=instance).update(artisan_name=instance.name)
+
+
+@receiver(pre_delete, sender=Artisan)
+def clear_feed_artisan(sender, instance, **kwargs):
+    FeedItem.objects.filter(post__mentioned_artisan=instance).update(artisan_name='')
+
+
+@receiver([post_save, post_delete], sender=Category)
+@receiver([post_save, post_delete], sender=Region)
+@receiver([post_save, post_delete], sender=Product)
+@receiver([post_save, post_delete], sender=Artisan)
+@receiver([post_save, post_delete], sender=CulturalStory)
+@receiver([post_save, post_delete], sender=GalleryImage)
+def invalidate_cached_queries(sender, **kwargs):
+    bump_version(sender.CACHE_VERSION_KEY)
@@ -0,0 +1,246 @@
+import time
+import uuid
+from decimal import Decimal
+from io import StringIO
+
+from django.contrib.auth import BACKEND_SESSION_KEY, get_user
+from django.contrib.auth.models import User
+from django.contrib.sessions.backends.db import SessionStore
+from django.core.exceptions import ValidationError
+from django.core.management import call_command
+from django.db import IntegrityError, connection, transaction
+from django.http import HttpResponse
+from django.test import RequestFactory, TestCase, TransactionTestCase
+from django.test.utils import CaptureQueriesContext
+
+from kalakriti import activity
+from kalakriti.middleware import LEGACY_BACKEND, PROFILE_BACKEND, ProfileBackendSessionMiddleware
+from kalakriti.models import (
+    Artisan, GalleryImage, Order, OrderItem, Product, ProductActivity, Region, Seller, UserProfile,
+)
+
+
+class RecordActivityTests(TransactionTestCase):
+    def setUp(self):
+        user = User.objects.create_user('maker', password='unused')
+        self.seller = Seller.objects.create(user=user, shop_name='Maker Studio', phone='9000000000', state='Goa')
+        self.product = Product.objects.create(
+            name='Clay Vase', slug='clay-vase', description='Hand thrown.', price=100,
+            image='products/clay-vase.jpg', seller=self.seller,
+        )
+
+    def test_rollback_does_not_discard_queued_rows(self):
+        for _ in range(activity.FLUSH_SIZE - 1):
+            activity.record_activity(self.seller.pk, self.product.pk, ProductActivity.VIEW)
+        with self.assertRaises(RuntimeError):
+            with transaction.atomic():
+                activity.record_activity(self.seller.pk, self.product.pk, ProductActivity.CLICK)
+                raise RuntimeError
+        activity.flush_activity()
+        self.assertEqual(ProductActivity.objects.count(), activity.FLUSH_SIZE)
+        self.assertFalse(ProductActivity.objects.exclude(seller_shop_name='Maker Studio').exists())
+
+    def test_rows_for_deleted_products_are_skipped(self):
+        for _ in range(5):
+            activity.record_activity(self.seller.pk, self.product.pk, ProductActivity.VIEW)
+        activity.record_activity(self.seller.pk, uuid.uuid4(), ProductActivity.VIEW)
+        activity.flush_activity()
+        self.assertEqual(ProductActivity.objects.count(), 5)
+        self.assertEqual(activity._pending, [])
+
+    def test_idle_buffer_is_flushed(self):
+        activity.record_activity(self.seller.pk, self.product.pk, ProductActivity.VIEW)
+        deadline = time.monotonic() + activity.FLUSH_INTERVAL * 5
+        while not ProductActivity.objects.exists() and time.monotonic() < deadline:
+            time.sleep(0.1)
+        self.assertEqual(ProductActivity.objects.count(), 1)
+
+
+class OrderTotalTests(TestCase):
+    """Order.total_amount is maintained by the OrderItem triggers from migration 0020.
+
+    SQLite drops a table's triggers whenever a migration rebuilds it, so
+    these fail if a later migration on OrderItem forgets to recreate them.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        user = User.objects.create_user('buyer', password='unused')
+        cls.product = Product.objects.create(
+            name='Clay Vase', slug='clay-vase', description='Hand thrown.', price=100,
+            image='products/clay-vase.jpg',
+        )
+        cls.order = Order.objects.create(user=user, shipping_address='Panaji, Goa')
+
+    def test_triggers_exist(self):
+        if connection.vendor not in ('postgresql', 'sqlite'):
+            self.skipTest('order total triggers are only installed on PostgreSQL and SQLite')
+        with connection.cursor() as cursor:
+            if connection.vendor == 'sqlite':
+                cursor.execute("SELECT name FROM sqlite_master WHERE type = 'trigger' AND tbl_name = %s",
+                               [OrderItem._meta.db_table])
+            else:
+                cursor.execute('SELECT tgname FROM pg_trigger WHERE tgrelid = %s::regclass AND NOT tgisinternal',
+                               [OrderItem._meta.db_table])
+            self.assertTrue(cursor.fetchall())
+
+    def test_total_follows_items(self):
+        item = OrderItem.objects.create(order=self.order, product=self.product, quantity=2, price=100)
+        self.order.refresh_from_db()
+        self.assertEqual(self.order.total_amount, 200)
+
+        item.quantity = 3
+        item.save()
+        self.order.refresh_from_db()
+        self.assertEqual(self.order.total_amount, 300)
+
+        item.delete()
+        self.order.refresh_from_db()
+        self.assertEqual(self.order.total_amount, 0)
+
+    def test_save_keeps_trigger_total(self):
+        stale = Order.objects.get(pk=self.order.pk)
+        OrderItem.objects.create(order=self.order, product=self.product, quantity=1, price=100)
+        stale.status = 'shipped'
+        stale.save()
+        self.order.refresh_from_db()
+        self.assertEqual((self.order.status, self.order.total_amount), ('shipped', 100))
+
+    def test_save_does_not_load_deferred_fields(self):
+        order = Order.lean.only('id', 'status').get(pk=self.order.pk)
+        order.status = 'processing'
+        with CaptureQueriesContext(connection) as queries:
+            order.save()
+        self.assertEqual(len(queries.captured_queries), 1)
+        self.order.refresh_from_db()
+        self.assertEqual(self.order.status, 'processing')
+
+
+class RefreshSellerStatsTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.pottery = Seller.objects.create(
+            user=User.objects.create_user('potter', password='unused'),
+            shop_name='Pottery House', phone='9000000001', state='Rajasthan', total_products=99,
+        )
+        cls.weaving = Seller.objects.create(
+            user=User.objects.create_user('weaver', password='unused'),
+            shop_name='Weaving Hall', phone='9000000002', state='Bihar',
+        )
+        cls.idle = Seller.objects.create(
+            user=User.objects.create_user('idle', password='unused'),
+            shop_name='Idle Shop', phone='9000000003', state='Goa', total_sales=Decimal('10.00'), rating=Decimal('4.00'),
+        )
+        vase, bowl, stole = (
+            Product.objects.create(
+                name=name, slug=slug, description='Handmade.', price=price, rating=rating,
+                image=f'products/{slug}.jpg', seller=seller,
+            )
+            for name, slug, price, rating, seller in (
+                ('Vase', 'vase', 100, Decimal('4.60'), cls.pottery),
+                ('Bowl', 'bowl', 100, Decimal('4.20'), cls.pottery),
+                ('Stole', 'stole', 50, Decimal('3.00'), cls.weaving),
+            )
+        )
+        buyer = User.objects.create_user('buyer', password='unused')
+        delivered = Order.objects.create(user=buyer, status='delivered', shipping_address='Jaipur')
+        cancelled = Order.objects.create(user=buyer, status='cancelled', shipping_address='Jaipur')
+        OrderItem.objects.create(order=delivered, product=vase, quantity=2, price=100)
+        OrderItem.objects.create(order=delivered, product=stole, quantity=1, price=50)
+        OrderItem.objects.create(order=cancelled, product=bowl, quantity=5, price=100)
+
+    def test_refresh_seller_stats(self):
+        call_command('refresh_seller_stats', stdout=StringIO())
+        stats = {
+            seller.shop_name: (seller.total_products, seller.total_sales, seller.rating)
+            for seller in Seller.objects.all()
+        }
+        self.assertEqual(stats, {
+            'Pottery House': (2, Decimal('200.00'), Decimal('4.40')),
+            'Weaving Hall': (1, Decimal('50.00'), Decimal('3.00')),
+            'Idle Shop': (0, Decimal('0.00'), Decimal('0.00')),
+        })
+        self.assertIsInstance(Seller.objects.get(pk=self.pottery.pk).rating, Decimal)
+
+
+class SessionUserTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user('weaver', password='unused')
+        UserProfile.objects.create(user=cls.user, user_type='seller')
+        Seller.objects.create(user=cls.user, shop_name='Loom Works', phone='9000000001', state='Assam')
+
+    def _request(self, backend):
+        request = RequestFactory().get('/')
+        self.client.force_login(self.user, backend=backend)
+        request.session = SessionStore(self.client.session.session_key)
+        request.session.keys()  # load the session outside the counted queries
+        return request
+
+    def test_session_user_loads_profiles_in_one_query(self):
+        request = self._request(PROFILE_BACKEND)
+        with self.assertNumQueries(1):
+            user = get_user(request)
+            self.assertEqual(user.profile.user_type, 'seller')
+            self.assertEqual(user.seller_profile.shop_name, 'Loom Works')
+
+    def test_legacy_session_is_moved_to_profile_backend(self):
+        request = self._request(LEGACY_BACKEND)
+        ProfileBackendSessionMiddleware(lambda request: HttpResponse())(request)
+        self.assertEqual(request.session[BACKEND_SESSION_KEY], PROFILE_BACKEND)
+        with self.assertNumQueries(1):
+            user = get_user(request)
+            self.assertEqual(user.seller_profile.shop_name, 'Loom Works')
+
+
+class ProductSearchTests(TestCase):
+    """Product.objects.search() must match the trigram indexes from migration 0027."""
+
+    @classmethod
+    def setUpTestData(cls):
+        Product.objects.create(
+            name='Blue Pottery Vase', slug='blue-pottery-vase', description='Jaipur glaze.', price=100,
+            image='products/blue-pottery-vase.jpg',
+        )
+
+    def test_search_matches_case_insensitively(self):
+        self.assertEqual([p.slug for p in Product.objects.search('POTTERY')], ['blue-pottery-vase'])
+
+    def test_search_uses_trigram_indexes(self):
+        if connection.vendor != 'postgresql':
+            self.skipTest('trigram indexes are only installed on PostgreSQL')
+        queryset = Product.objects.search('pottery')
+        table = connection.ops.quote_name(Product._meta.db_table)
+        sql = str(queryset.query)
+        self.assertIn('UPPER(%s."name"::text) LIKE' % table, sql)
+        self.assertIn('UPPER(%s."description"::text) LIKE' % table, sql)
+        with transaction.atomic(), connection.cursor() as cursor:
+            # The table is tiny, so keep the planner from preferring a scan.
+            cursor.execute('SET LOCAL enable_seqscan = off')
+            plan = queryset.explain()
+        self.assertIn('prod_name_upper_trgm', plan)
+        self.assertIn('prod_desc_upper_trgm', plan)
+
+
+class GalleryImageOwnerTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.region = Region.objects.create(
+            name='Rajasthan', slug='rajasthan', description='Desert state.', image='regions/rajasthan.jpg',
+        )
+        cls.artisan = Artisan.objects.create(
+            name='Meera', slug='meera', bio='Potter.', image='artisans/meera.jpg', region=cls.region,
+            specialty='Blue pottery', years_of_experience=12,
+        )
+
+    def test_single_owner_is_accepted(self):
+        image = GalleryImage(title='Kiln', image='gallery/kiln.jpg', artisan=self.artisan)
+        image.full_clean()
+        image.save()
+
+    def test_two_owners_are_rejected(self):
+        image = GalleryImage(title='Kiln', image='gallery/kiln.jpg', artisan=self.artisan, region=self.region)
+        with self.assertRaisesMessage(ValidationError, 'exactly one artisan, product or region'):
+            image.full_clean()
+        with self.assertRaises(IntegrityError), transaction.atomic():
+            image.save()